@@ -23,7 +23,7 @@ from entsoe_client.model.load.gl_market_document import GlMarketDocument
 from entsoe_client.model.market.publication_market_document import (
     PublicationMarketDocument,
 )
-from entsoe_client.utils.xml_namespace_utils import remove_xml_namespaces
+from entsoe_client.utils.xml_namespace_utils import remove_xml_namespaces_async
 
 logger = logging.getLogger(__name__)
 
@@ -381,7 +381,7 @@ class DefaultEntsoEClient(EntsoEClient):
             if document_type == XmlDocumentType.PUBLICATION_MARKET_DOCUMENT:
                 logger.debug("Received Publication_MarketDocument, parsing...")
                 # Strip namespaces to enable parsing of both 7:3 and 7:0 namespace variants
-                cleaned_xml = remove_xml_namespaces(xml_response)
+                cleaned_xml = await remove_xml_namespaces_async(xml_response)
                 return PublicationMarketDocument.from_xml(cleaned_xml.encode())
 
             # Unexpected document type for market domain requests
@@ -1,4 +1,3 @@
-import re
 from enum import Enum
 from typing import Final, NoReturn
 
@@ -21,19 +20,37 @@ class XmlDocumentDetector:
     for routing to appropriate parsers.
     """
 
-    # Regex pattern to extract root element name from XML
-    # Captures full element name including namespace prefix (e.g., ns:ElementName)
-    ROOT_ELEMENT_PATTERN: Final[re.Pattern[str]] = re.compile(
-        r"<\s*([a-zA-Z_][a-zA-Z0-9_.-]*(?::[a-zA-Z_][a-zA-Z0-9_.-]*)?)[\s>]",
-        re.MULTILINE | re.DOTALL,
+    # Supported root element names mapped to their document types
+    ROOT_ELEMENT_TYPES: Final[dict[str, XmlDocumentType]] = {
+        document_type.value: document_type for document_type in XmlDocumentType
+    }
+
+    # Names of the supported roots, probed before scanning the name
+    ROOT_ELEMENT_PREFIXES: Final[tuple[bytes, ...]] = tuple(
+        root_element.encode() for root_element in ROOT_ELEMENT_TYPES
     )
 
+    # UTF-8 byte order mark, kept at the start of decoded httpx response text
+    BYTE_ORDER_MARK: Final[bytes] = b"\xef\xbb\xbf"
+
+    # XML whitespace allowed around the prolog
+    WHITESPACE: Final[bytes] = b" \t\r\n"
+
+    # Bytes that end the root element name
+    NAME_TERMINATORS: Final[bytes] = WHITESPACE + b"/>"
+
+    # Number of leading characters or bytes searched for the root element
+    SCAN_LIMIT: Final[int] = 4096
+
     @classmethod
-    def detect_document_type(cls, xml_content: str) -> XmlDocumentType:
+    def detect_document_type(
+        cls, xml_content: str | bytes | bytearray | memoryview
+    ) -> XmlDocumentType:
         """Detect XML document type from root element.
 
         Args:
-            xml_content: Raw XML content from ENTSO-E API response
+            xml_content: Raw XML content from ENTSO-E API response, either
+                decoded text or the undecoded response body
 
         Returns:
             XmlDocumentType enum value for the detected document type
@@ -49,32 +66,135 @@ class XmlDocumentDetector:
         def _raise_unsupported_document_type(root_element: str) -> NoReturn:
             raise EntsoEApiRequestError.unsupported_document_type(root_element)
 
-        if not xml_content or not isinstance(xml_content, str):
+        if not xml_content or not isinstance(
+            xml_content, (str, bytes, bytearray, memoryview)
+        ):
             msg = "XML content is empty or invalid"
             raise EntsoEApiRequestError.invalid_xml_content(msg)
 
         try:
-            # Find the first XML element (root element)
-            match = cls.ROOT_ELEMENT_PATTERN.search(xml_content.strip())
+            # The root start tag always sits near the top, so the scan never
+            # looks past SCAN_LIMIT however large the document is
+            head = xml_content[: cls.SCAN_LIMIT]
+            content = head.encode() if isinstance(head, str) else bytes(head)
 
-            if not match:
-                _raise_invalid_xml_content()
+            root_element = cls._find_root_element(content)
 
-            root_element = match.group(1)
+            if root_element is None:
+                _raise_invalid_xml_content()
 
-            # Map root element to document type (only exact matches, no namespace prefixes)
-            if root_element == "GL_MarketDocument":
-                return XmlDocumentType.GL_MARKET_DOCUMENT
-            if root_element == "Publication_MarketDocument":
-                return XmlDocumentType.PUBLICATION_MARKET_DOCUMENT
-            if root_element == "Acknowledgement_MarketDocument":
-                return XmlDocumentType.ACKNOWLEDGEMENT_MARKET_DOCUMENT
+            # Only exact matches are supported, namespaced roots are rejected
+            document_type = cls.ROOT_ELEMENT_TYPES.get(root_element)
 
-            # Handle namespaced elements or unknown elements
-            _raise_unsupported_document_type(root_element)
+            if document_type is None:
+                _raise_unsupported_document_type(root_element)
 
         except EntsoEApiRequestError:
             # Re-raise our specific exceptions
             raise
         except Exception as e:
             raise EntsoEApiRequestError.document_type_detection_failed(str(e)) from e
+        else:
+            return document_type
+
+    @classmethod
+    def _find_root_element(cls, xml_content: bytes) -> str | None:
+        """Return the root element name, or None if no root element is found.
+
+        Only the bytes of the root start tag name are inspected once an
+        optional byte order mark and the prolog have been skipped.
+        """
+        start = cls._skip_prolog(
+            xml_content,
+            len(cls.BYTE_ORDER_MARK)
+            if xml_content.startswith(cls.BYTE_ORDER_MARK)
+            else 0,
+        )
+
+        if start == -1 or not xml_content.startswith(b"<", start):
+            return None
+
+        name_start = start + 1
+        while (
+            name_start < len(xml_content) and xml_content[name_start] in cls.WHITESPACE
+        ):
+            name_start += 1
+
+        supported_root = cls._match_root_prefix(xml_content, name_start)
+        if supported_root is not None:
+            return supported_root
+
+        for index in range(name_start, len(xml_content)):
+            byte = xml_content[index]
+            if byte in cls.NAME_TERMINATORS:
+                return xml_content[name_start:index].decode(errors="replace") or None
+            if byte == ord("<"):
+                return None
+
+        return None
+
+    @classmethod
+    def _skip_prolog(cls, xml_content: bytes, index: int = 0) -> int:
+        """Return the offset after the prolog, or -1 if it is unterminated.
+
+        Whitespace, stray text, the XML declaration, processing instructions,
+        comments and the DOCTYPE (including an internal subset) are stepped
+        over by offset, jumping to each terminator with ``bytes.find`` instead
+        of slicing off what has been consumed.
+        """
+        length = len(xml_content)
+
+        while True:
+            while index < length and xml_content[index] in cls.WHITESPACE:
+                index += 1
+
+            if xml_content.startswith(b"<?", index):
+                end = cls._find_end(xml_content, b"?>", index + 2)
+            elif xml_content.startswith(b"<!--", index):
+                end = cls._find_end(xml_content, b"-->", index + 4)
+            elif xml_content.startswith(b"<!", index):
+                end = cls._find_declaration_end(xml_content, index + 2)
+            elif xml_content.startswith(b"<", index):
+                return index
+            else:
+                # Text before the root is skipped, as long as a tag follows
+                end = xml_content.find(b"<", index)
+
+            if end == -1:
+                return -1
+            index = end
+
+    @staticmethod
+    def _find_end(xml_content: bytes, terminator: bytes, start: int) -> int:
+        """Return the offset just past terminator, or -1 if it is missing."""
+        end = xml_content.find(terminator, start)
+        return -1 if end == -1 else end + len(terminator)
+
+    @classmethod
+    def _find_declaration_end(cls, xml_content: bytes, start: int) -> int:
+        """Return the offset just past a ``<!`` declaration, or -1.
+
+        A ``[`` before the closing ``>`` opens a DOCTYPE internal subset,
+        whose markup declarations end with ``]`` before the final ``>``.
+        """
+        close = xml_content.find(b">", start)
+        subset = xml_content.find(b"[", start, close)
+        if close != -1 and subset != -1:
+            subset_end = xml_content.find(b"]", subset + 1)
+            if subset_end == -1:
+                return -1
+            return cls._find_end(xml_content, b">", subset_end + 1)
+        return -1 if close == -1 else close + 1
+
+    @classmethod
+    def _match_root_prefix(cls, xml_content: bytes, start: int) -> str | None:
+        """Return the supported root name starting at start, if any."""
+        for prefix in cls.ROOT_ELEMENT_PREFIXES:
+            end = start + len(prefix)
+            if (
+                xml_content.startswith(prefix, start)
+                and end < len(xml_content)
+                and xml_content[end] in cls.NAME_TERMINATORS
+            ):
+                return prefix.decode()
+        return None
@@ -12,6 +12,8 @@ from entsoe_client.exceptions import ConfigValidationError
 # Constants
 MIN_API_TOKEN_LENGTH = 10
 REDACTED_TOKEN = "***REDACTED***"  # noqa: S105
+# Use the libyaml-backed safe loader when PyYAML was built with it
+YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 class HttpConfig(BaseModel):
@@ -43,6 +45,10 @@ class HttpConfig(BaseModel):
         le=100,
         description="Maximum keep-alive connections",
     )
+    keepalive_expiry: timedelta = Field(
+        default=timedelta(seconds=30),
+        description="Idle time before a keep-alive connection is closed",
+    )
 
 
 class RetryConfig(BaseModel):
@@ -183,7 +189,7 @@ class EntsoEClientConfig(BaseSettings):
             data = json.loads(config_path.read_text())
             return cls.model_validate(data)
         if config_path.suffix.lower() in {".yaml", ".yml"}:
-            data = yaml.safe_load(config_path.read_text())
+            data = yaml.load(config_path.read_text(), Loader=YAML_SAFE_LOADER)  # noqa: S506
             return cls.model_validate(data)
         raise ConfigValidationError.unsupported_config_format(config_path.suffix)
 
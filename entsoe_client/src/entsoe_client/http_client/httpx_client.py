@@ -49,6 +49,7 @@ class HttpxClient(HttpClient):
             limits = httpx.Limits(
                 max_connections=self._config.http.max_connections,
                 max_keepalive_connections=self._config.http.max_keepalive_connections,
+                keepalive_expiry=self._config.http.keepalive_expiry.total_seconds(),
             )
 
             # Timeout configuration
@@ -1,11 +1,12 @@
+import functools
 import logging
 from collections.abc import Awaitable, Callable
 from typing import TypeVar
 
 from tenacity import (
+    AsyncRetrying,
     RetryError,
     before_sleep_log,
-    retry,
     retry_if_exception_type,
     stop_after_attempt,
     wait_exponential,
@@ -27,32 +28,47 @@ T = TypeVar("T")
 class RetryHandler:
     """Handles retry logic for HTTP requests using tenacity."""
 
+    _RETRYABLE_EXCEPTIONS: tuple[type[HttpClientError], ...] = (
+        HttpClientTimeoutError,
+        HttpClientConnectionError,
+        HttpClientRetryError,
+    )
+
     def __init__(self, config: RetryConfig):
         self._config = config
-
-    async def execute(self, operation: Callable[[], Awaitable[T]]) -> T:
-        """Execute the operation with retry logic."""
-        retry_decorator = retry(
-            stop=stop_after_attempt(self._config.max_attempts),
+        # The policy is built once per handler; wraps() copies it on every
+        # call, so concurrent requests never share retry state
+        self._retrying = AsyncRetrying(
+            stop=stop_after_attempt(config.max_attempts),
             wait=wait_exponential(
-                multiplier=self._config.base_delay.total_seconds(),
-                max=self._config.max_delay.total_seconds(),
-                exp_base=self._config.exponential_base,
+                multiplier=config.base_delay.total_seconds(),
+                max=config.max_delay.total_seconds(),
+                exp_base=config.exponential_base,
             ),
-            retry=retry_if_exception_type(self._get_retryable_exceptions()),
+            retry=retry_if_exception_type(self._RETRYABLE_EXCEPTIONS),
             before_sleep=before_sleep_log(logger, logging.WARNING),
             reraise=True,
         )
 
+    async def execute(self, operation: Callable[[], Awaitable[T]]) -> T:
+        """Execute the operation with retry logic."""
+
+        # Tenacity only awaits coroutine functions; callers usually pass a
+        # lambda returning a coroutine, which it would treat as synchronous.
+        # Copying the operation's name keeps it in the retry log messages.
+        @functools.wraps(operation)
+        async def attempt() -> T:
+            return await operation()
+
         try:
-            return await retry_decorator(operation)()
+            return await self._retrying.wraps(attempt)()
         except RetryError as e:
             # Re-raise the original exception, not the RetryError
             if e.last_attempt.exception():
                 raise e.last_attempt.exception() from e
             msg = "Request execution failed"
             raise HttpClientError(msg) from e
-        except self._get_retryable_exceptions():
+        except self._RETRYABLE_EXCEPTIONS:
             # Re-raise retryable exceptions as-is (tenacity already handled retries)
             raise
         except Exception as e:
@@ -62,4 +78,4 @@ class RetryHandler:
 
     def _get_retryable_exceptions(self) -> tuple:
         """Get tuple of retryable exception types."""
-        return HttpClientTimeoutError, HttpClientConnectionError, HttpClientRetryError
+        return self._RETRYABLE_EXCEPTIONS
@@ -1,6 +1,7 @@
 import re
 import warnings
 from enum import Enum
+from functools import cache
 from typing import Self
 
 from entsoe_client.exceptions.unknown_area_code_error import UnknownAreaCodeError
@@ -580,12 +581,17 @@ class AreaCode(Enum):
         self.description = description
         self.area_code = area_code
 
+    @classmethod
+    @cache
+    def _members_by_code(cls) -> dict[str, Self]:
+        return {member.code: member for member in cls}
+
     @classmethod
     def from_code(cls, code: str) -> Self:
-        for member in cls:
-            if member.code == code:
-                return member
-        raise UnknownAreaCodeError(code)
+        member = cls._members_by_code().get(code)
+        if member is None:
+            raise UnknownAreaCodeError(code)
+        return member
 
     def _safe_from_code(self, code: str) -> Self | None:
         try:
@@ -2,6 +2,7 @@
 
 from .market_period import MarketPeriod
 from .market_point import MarketPoint
+from .market_point_arrays import MarketPointArrays
 from .market_time_interval import MarketTimeInterval
 from .market_time_series import MarketTimeSeries
 from .publication_market_document import PublicationMarketDocument
@@ -9,6 +10,7 @@ from .publication_market_document import PublicationMarketDocument
 __all__ = [
     "MarketPeriod",
     "MarketPoint",
+    "MarketPointArrays",
     "MarketTimeInterval",
     "MarketTimeSeries",
     "PublicationMarketDocument",
@@ -0,0 +1,27 @@
+"""Columnar point data extracted from ENTSO-E Publication Market Documents."""
+
+from array import array
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class MarketPointArrays:
+    """
+    Structure-of-arrays view over every Point of a Publication Market Document.
+
+    All arrays share the same length and are index-aligned: element ``i`` of each
+    array describes the same Point. Missing price or quantity values are stored as
+    NaN so the float arrays stay dense.
+    A missing position is stored as 0, which never collides with a real one
+    because ENTSO-E positions start at 1. The arrays expose the buffer protocol,
+    so numerical consumers can wrap them without copying (e.g.
+    ``numpy.frombuffer``).
+    """
+
+    series_indices: array[int]
+    positions: array[int]
+    price_amounts: array[float]
+    quantities: array[float]
+
+    def __len__(self) -> int:
+        return len(self.positions)
@@ -1,5 +1,6 @@
 """Publication Market Document model for ENTSO-E Market Domain responses."""
 
+from array import array
 from datetime import datetime
 
 from pydantic import field_serializer, field_validator
@@ -10,6 +11,7 @@ from entsoe_client.model.common.document_type import DocumentType
 from entsoe_client.model.common.market_role_type import MarketRoleType
 
 from .market_participant_mrid import MarketParticipantMRID
+from .market_point_arrays import MarketPointArrays
 from .market_time_interval import MarketTimeInterval
 from .market_time_series import MarketTimeSeries
 
@@ -99,3 +101,45 @@ class PublicationMarketDocument(BaseXmlModel, tag="Publication_MarketDocument"):
             return date_time_adapter.decode_content(value)
 
         return value
+
+    def to_arrays(self) -> MarketPointArrays:
+        """
+        Flatten all TimeSeries points into index-aligned typed arrays.
+
+        Numerical consumers (aggregations across every TimeSeries, for example)
+        can work on contiguous columns instead of walking the nested
+        TimeSeries -> Period -> Point model graph for every calculation.
+
+        Returns:
+            MarketPointArrays holding the series index, position, price amount and
+            quantity of every point, in document order. Points without a
+            position get 0, which is never a valid 1-based position
+        """
+        nan = float("nan")
+        series_indices: array[int] = array("i")
+        positions: array[int] = array("i")
+        price_amounts: array[float] = array("d")
+        quantities: array[float] = array("d")
+
+        for series_index, time_series in enumerate(self.timeSeries):
+            points = time_series.period.points
+            series_indices.extend([series_index] * len(points))
+            positions.extend(
+                [0 if point.position is None else point.position for point in points]
+            )
+            price_amounts.extend(
+                [
+                    nan if point.price_amount is None else point.price_amount
+                    for point in points
+                ]
+            )
+            quantities.extend(
+                [nan if point.quantity is None else point.quantity for point in points]
+            )
+
+        return MarketPointArrays(
+            series_indices=series_indices,
+            positions=positions,
+            price_amounts=price_amounts,
+            quantities=quantities,
+        )
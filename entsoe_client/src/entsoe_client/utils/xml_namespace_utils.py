@@ -4,6 +4,7 @@ This module provides utilities to strip XML namespaces from ENTSO-E documents,
 enabling namespace-agnostic parsing of Publication Market Documents.
 """
 
+import asyncio
 import xml.etree.ElementTree as ET
 
 
@@ -43,3 +44,23 @@ def remove_xml_namespaces(xml_content: str) -> str:
     except ET.ParseError as e:
         error_msg = f"Failed to parse XML content: {e}"
         raise ValueError(error_msg) from e
+
+
+async def remove_xml_namespaces_async(xml_content: str) -> str:
+    """
+    Remove XML namespaces without blocking the running event loop.
+
+    The parse and serialize pass of remove_xml_namespaces is CPU-bound, so it
+    is offloaded to the default thread-pool executor. This keeps other
+    in-flight requests progressing while large documents are being cleaned.
+
+    Args:
+        xml_content: Raw XML string with namespace declarations
+
+    Returns:
+        XML string with all namespace information removed
+
+    Raises:
+        ValueError: If XML content cannot be parsed
+    """
+    return await asyncio.to_thread(remove_xml_namespaces, xml_content)
@@ -1,6 +1,9 @@
 """Tests for MarketDomainRequestBuilder."""
 
+import re
+from collections.abc import Callable
 from datetime import UTC, datetime, timezone
+from typing import Any
 
 import pytest
 
@@ -12,6 +15,25 @@ from entsoe_client.model.common.area_code import AreaCode
 from entsoe_client.model.common.business_type import BusinessType
 from entsoe_client.model.common.document_type import DocumentType
 
+DOMAIN_VALIDATION_CASES = [
+    pytest.param(
+        AreaCode.CZECH_REPUBLIC,
+        AreaCode.FINLAND,
+        "build_day_ahead_prices",
+        re.escape(
+            "in_domain (10YCZ-CEPS-----N) must equal out_domain (10YFI-1--------U)"
+        ),
+        id="prices-different-domains",
+    ),
+    pytest.param(
+        AreaCode.CZECH_REPUBLIC,
+        AreaCode.CZECH_REPUBLIC,
+        "build_physical_flows",
+        "Physical flows require different domains",
+        id="flows-same-domains",
+    ),
+]
+
 
 class TestMarketDomainRequestBuilderSuccess:
     """Success scenarios for MarketDomainRequestBuilder."""
@@ -66,73 +88,89 @@ class TestMarketDomainRequestBuilderSuccess:
 
 
 class TestMarketDomainRequestBuilderValidation:
-    """Validation tests for MarketDomainRequestBuilder."""
-
-    def test_domain_validation_failure(self) -> None:
-        """Test that mismatched domains fail validation."""
-        builder = MarketDomainRequestBuilder(
-            in_domain=AreaCode.CZECH_REPUBLIC,
-            out_domain=AreaCode.FINLAND,
-            period_start=datetime(2024, 1, 1, tzinfo=UTC),
-            period_end=datetime(2024, 1, 2, tzinfo=UTC),
-        )
-        with pytest.raises(MarketDomainRequestBuilderError) as exc_info:
-            builder.build_day_ahead_prices()
-
-        error_msg = str(exc_info.value)
-        assert (
-            "in_domain (10YCZ-CEPS-----N) must equal out_domain (10YFI-1--------U)"
-            in error_msg
-        )
-
-    def test_missing_in_domain_validation(self) -> None:
+    """Validation tests for MarketDomainRequestBuilder.
+
+    The opposite domain rules of prices and physical flows are covered by
+    test_domain_validation_failure together with the success tests
+    test_build_day_ahead_prices_success and test_build_physical_flows_success.
+    """
+
+    @pytest.fixture
+    def make_builder(self) -> Callable[..., MarketDomainRequestBuilder]:
+        """Build a valid day-ahead price builder, overriding selected arguments."""
+
+        def _make_builder(**overrides: Any) -> MarketDomainRequestBuilder:
+            kwargs: dict[str, Any] = {
+                "in_domain": AreaCode.CZECH_REPUBLIC,
+                "out_domain": AreaCode.CZECH_REPUBLIC,
+                "period_start": datetime(2024, 1, 1, tzinfo=UTC),
+                "period_end": datetime(2024, 1, 2, tzinfo=UTC),
+            }
+            kwargs.update(overrides)
+            return MarketDomainRequestBuilder(**kwargs)
+
+        return _make_builder
+
+    @pytest.mark.parametrize(
+        ("in_domain", "out_domain", "build_method", "expected_message"),
+        DOMAIN_VALIDATION_CASES,
+    )
+    def test_domain_validation_failure(
+        self,
+        make_builder: Callable[..., MarketDomainRequestBuilder],
+        in_domain: AreaCode,
+        out_domain: AreaCode,
+        build_method: str,
+        expected_message: str,
+    ) -> None:
+        """Test that prices reject differing domains and flows reject equal ones."""
+        builder = make_builder(in_domain=in_domain, out_domain=out_domain)
+
+        with pytest.raises(MarketDomainRequestBuilderError, match=expected_message):
+            getattr(builder, build_method)()
+
+    def test_missing_in_domain_validation(
+        self, make_builder: Callable[..., MarketDomainRequestBuilder]
+    ) -> None:
         """Test validation fails for missing in_domain."""
-        with pytest.raises(MarketDomainRequestBuilderError) as exc_info:
-            MarketDomainRequestBuilder(
-                in_domain=None,  # type: ignore[arg-type]
-                out_domain=AreaCode.CZECH_REPUBLIC,
-                period_start=datetime(2024, 1, 1, tzinfo=UTC),
-                period_end=datetime(2024, 1, 2, tzinfo=UTC),
-            )
-
-        assert "in_domain is required" in str(exc_info.value)
-
-    def test_missing_out_domain_validation(self) -> None:
+        with pytest.raises(
+            MarketDomainRequestBuilderError, match="in_domain is required"
+        ):
+            make_builder(in_domain=None)
+
+    def test_missing_out_domain_validation(
+        self, make_builder: Callable[..., MarketDomainRequestBuilder]
+    ) -> None:
         """Test validation fails for missing out_domain."""
-        with pytest.raises(MarketDomainRequestBuilderError) as exc_info:
-            MarketDomainRequestBuilder(
-                in_domain=AreaCode.CZECH_REPUBLIC,
-                out_domain=None,  # type: ignore[arg-type]
-                period_start=datetime(2024, 1, 1, tzinfo=UTC),
-                period_end=datetime(2024, 1, 2, tzinfo=UTC),
-            )
-
-        assert "out_domain is required" in str(exc_info.value)
-
-    def test_period_start_after_end_validation(self) -> None:
+        with pytest.raises(
+            MarketDomainRequestBuilderError, match="out_domain is required"
+        ):
+            make_builder(out_domain=None)
+
+    def test_period_start_after_end_validation(
+        self, make_builder: Callable[..., MarketDomainRequestBuilder]
+    ) -> None:
         """Test validation fails when period_start is after period_end."""
-        with pytest.raises(MarketDomainRequestBuilderError) as exc_info:
-            MarketDomainRequestBuilder(
-                in_domain=AreaCode.CZECH_REPUBLIC,
-                out_domain=AreaCode.CZECH_REPUBLIC,
+        with pytest.raises(
+            MarketDomainRequestBuilderError,
+            match="Period start must be before period end",
+        ):
+            make_builder(
                 period_start=datetime(2024, 1, 2, tzinfo=UTC),
                 period_end=datetime(2024, 1, 1, tzinfo=UTC),
             )
 
-        assert "Period start must be before period end" in str(exc_info.value)
-
-    def test_date_range_exceeds_one_year_validation(self) -> None:
+    def test_date_range_exceeds_one_year_validation(
+        self, make_builder: Callable[..., MarketDomainRequestBuilder]
+    ) -> None:
         """Test validation fails for date ranges exceeding one year."""
-        with pytest.raises(MarketDomainRequestBuilderError) as exc_info:
-            MarketDomainRequestBuilder(
-                in_domain=AreaCode.CZECH_REPUBLIC,
-                out_domain=AreaCode.CZECH_REPUBLIC,
-                period_start=datetime(2024, 1, 1, tzinfo=UTC),
+        with pytest.raises(
+            MarketDomainRequestBuilderError, match="Date range cannot exceed one year"
+        ):
+            make_builder(
                 period_end=datetime(2025, 1, 2, tzinfo=UTC),  # More than one year
             )
 
-        assert "Date range cannot exceed one year" in str(exc_info.value)
-
 
 class TestPhysicalFlowsBuilder:
     """Test physical flows request building."""
@@ -151,58 +189,7 @@ class TestPhysicalFlowsBuilder:
         assert (
             request.document_type == DocumentType.AGGREGATED_ENERGY_DATA_REPORT
         )  # A11
-        assert request.business_type == BusinessType.PHYSICAL_FLOWS  # A66
+        # BusinessType is not sent for physical flows
+        assert request.business_type is None
         assert request.in_domain == AreaCode.CZECH_REPUBLIC
         assert request.out_domain == AreaCode.SLOVAKIA
-
-    def test_build_physical_flows_same_domains_fails(self) -> None:
-        """Test that same domains raise validation error for flows."""
-        builder = MarketDomainRequestBuilder(
-            in_domain=AreaCode.CZECH_REPUBLIC,  # Same domain
-            out_domain=AreaCode.CZECH_REPUBLIC,  # Same domain - INVALID
-            period_start=datetime(2016, 1, 1, tzinfo=UTC),
-            period_end=datetime(2016, 1, 2, tzinfo=UTC),
-        )
-
-        with pytest.raises(MarketDomainRequestBuilderError) as exc_info:
-            builder.build_physical_flows()
-
-        assert "Physical flows require different domains" in str(exc_info.value)
-
-    def test_validation_difference_with_price_requests(self) -> None:
-        """Test that physical flows and price requests have opposite domain validation."""
-        # Same domains - valid for prices, invalid for flows
-        same_domain_builder = MarketDomainRequestBuilder(
-            in_domain=AreaCode.CZECH_REPUBLIC,
-            out_domain=AreaCode.CZECH_REPUBLIC,  # Same as in_domain
-            period_start=datetime(2016, 1, 1, tzinfo=UTC),
-            period_end=datetime(2016, 1, 2, tzinfo=UTC),
-        )
-
-        # Price request should succeed with same domains
-        price_request = same_domain_builder.build_day_ahead_prices()
-        assert price_request.business_type == BusinessType.DAY_AHEAD_PRICES
-
-        # Physical flows request should fail with same domains
-        with pytest.raises(MarketDomainRequestBuilderError) as exc_info:
-            same_domain_builder.build_physical_flows()
-        assert "Physical flows require different domains" in str(exc_info.value)
-
-        # Different domains - invalid for prices, valid for flows
-        different_domain_builder = MarketDomainRequestBuilder(
-            in_domain=AreaCode.CZECH_REPUBLIC,
-            out_domain=AreaCode.FINLAND,  # Different from in_domain
-            period_start=datetime(2016, 1, 1, tzinfo=UTC),
-            period_end=datetime(2016, 1, 2, tzinfo=UTC),
-        )
-
-        # Price request should fail with different domains
-        with pytest.raises(MarketDomainRequestBuilderError) as exc_info:
-            different_domain_builder.build_day_ahead_prices()
-        error_msg = str(exc_info.value)
-        assert "in_domain" in error_msg
-        assert "must equal out_domain" in error_msg
-
-        # Physical flows request should succeed with different domains
-        flows_request = different_domain_builder.build_physical_flows()
-        assert flows_request.business_type == BusinessType.PHYSICAL_FLOWS
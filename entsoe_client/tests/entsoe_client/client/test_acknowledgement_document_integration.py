@@ -1,7 +1,9 @@
 """Integration tests for acknowledgement document handling workflow."""
 
+import functools
+from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock
 
 import pytest
 import pytest_asyncio
@@ -17,27 +19,7 @@ from entsoe_client.model.acknowledgement import AcknowledgementMarketDocument
 from entsoe_client.model.common.area_code import AreaCode
 from entsoe_client.model.load.gl_market_document import GlMarketDocument
 
-
-class TestAcknowledgementDocumentIntegration:
-    """Integration tests for complete acknowledgement document workflow."""
-
-    @pytest.fixture
-    def mock_http_client(self) -> AsyncMock:
-        """Create a mock HTTP client for testing."""
-        mock_client = AsyncMock()
-        mock_client.get = AsyncMock(return_value="<xml>mock response</xml>")
-        mock_client.close = AsyncMock()
-        return mock_client
-
-    @pytest.fixture
-    def client_with_mock(self, mock_http_client: AsyncMock) -> DefaultEntsoEClient:
-        """Create a DefaultEntsoEClient with mocked HTTP client."""
-        return DefaultEntsoEClient(mock_http_client, "https://web-api.tp.entsoe.eu/api")
-
-    @pytest.fixture
-    def valid_gl_market_document_xml(self) -> str:
-        """Sample GL_MarketDocument XML response."""
-        return """<?xml version="1.0" encoding="UTF-8"?>
+VALID_GL_MARKET_DOCUMENT_XML = """<?xml version="1.0" encoding="UTF-8"?>
 <GL_MarketDocument xmlns="urn:iec62325.351:tc57wg16:451-6:generationloaddocument:3:0">
     <mRID>sample-gl-document-id</mRID>
     <revisionNumber>1</revisionNumber>
@@ -77,10 +59,7 @@ class TestAcknowledgementDocumentIntegration:
     </TimeSeries>
 </GL_MarketDocument>"""
 
-    @pytest.fixture
-    def no_data_acknowledgement_xml(self) -> str:
-        """Sample acknowledgement XML with reason code 999 (no data available)."""
-        return """<?xml version="1.0" encoding="UTF-8"?>
+NO_DATA_ACKNOWLEDGEMENT_XML = """<?xml version="1.0" encoding="UTF-8"?>
 <Acknowledgement_MarketDocument xmlns="urn:iec62325.351:tc57wg16:451-1:acknowledgementdocument:7:0">
     <mRID>ack-no-data-id</mRID>
     <createdDateTime>2025-08-04T12:00:00Z</createdDateTime>
@@ -93,10 +72,7 @@ class TestAcknowledgementDocumentIntegration:
     </Reason>
 </Acknowledgement_MarketDocument>"""
 
-    @pytest.fixture
-    def error_acknowledgement_xml(self) -> str:
-        """Sample acknowledgement XML with error reason code."""
-        return """<?xml version="1.0" encoding="UTF-8"?>
+ERROR_ACKNOWLEDGEMENT_XML = """<?xml version="1.0" encoding="UTF-8"?>
 <Acknowledgement_MarketDocument xmlns="urn:iec62325.351:tc57wg16:451-1:acknowledgementdocument:7:0">
     <mRID>ack-error-id</mRID>
     <createdDateTime>2025-08-04T12:00:00Z</createdDateTime>
@@ -109,6 +85,110 @@ class TestAcknowledgementDocumentIntegration:
     </Reason>
 </Acknowledgement_MarketDocument>"""
 
+
+@functools.lru_cache(maxsize=8)
+def _detect_document_type(xml_content: str) -> XmlDocumentType:
+    return XmlDocumentDetector.detect_document_type(xml_content)
+
+
+def _assert_gl_market_document_result(result: GlMarketDocument | None) -> None:
+    assert isinstance(result, GlMarketDocument)
+    assert result.mRID == "sample-gl-document-id"
+
+
+def _assert_no_data_result(result: GlMarketDocument | None) -> None:
+    assert result is None
+
+
+def _assert_acknowledgement_detected(
+    xml_content: str,
+    ack_doc: AcknowledgementMarketDocument,
+    predicate: Callable[[AcknowledgementMarketDocument], bool],
+    expected_reason_code: str,
+) -> AcknowledgementMarketDocument:
+    doc_type = _detect_document_type(xml_content)
+    assert doc_type == XmlDocumentType.ACKNOWLEDGEMENT_MARKET_DOCUMENT
+    assert predicate(ack_doc) is True
+    assert ack_doc.reason_code == expected_reason_code
+    return ack_doc
+
+
+class TestAcknowledgementDocumentIntegration:
+    """Integration tests for complete acknowledgement document workflow."""
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def mock_http_client(cls) -> AsyncMock:
+        """Create a mock HTTP client for testing."""
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(return_value="<xml>mock response</xml>")
+        mock_client.close = AsyncMock()
+        return mock_client
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def client_with_mock(cls, mock_http_client: AsyncMock) -> DefaultEntsoEClient:
+        """Create a DefaultEntsoEClient with mocked HTTP client."""
+        return DefaultEntsoEClient(mock_http_client, "https://web-api.tp.entsoe.eu/api")
+
+    @pytest.fixture
+    def mocked_get(
+        self, client_with_mock: DefaultEntsoEClient, monkeypatch: pytest.MonkeyPatch
+    ) -> AsyncMock:
+        """Replace the client's HTTP get with a fresh AsyncMock for one test."""
+        mock_get = AsyncMock()
+        monkeypatch.setattr(client_with_mock.http_client, "get", mock_get)
+        return mock_get
+
+    @pytest.fixture(scope="module")
+    def utc_now(self) -> datetime:
+        """Fixed reference time so request periods are deterministic."""
+        return datetime(2025, 8, 4, tzinfo=UTC)
+
+    @pytest.fixture(scope="module")
+    def valid_gl_market_document_xml(self) -> str:
+        """Sample GL_MarketDocument XML response."""
+        return VALID_GL_MARKET_DOCUMENT_XML
+
+    @pytest.fixture(scope="module")
+    def no_data_acknowledgement_xml(self) -> str:
+        """Sample acknowledgement XML with reason code 999 (no data available)."""
+        return NO_DATA_ACKNOWLEDGEMENT_XML
+
+    @pytest.fixture(scope="module")
+    def error_acknowledgement_xml(self) -> str:
+        """Sample acknowledgement XML with error reason code."""
+        return ERROR_ACKNOWLEDGEMENT_XML
+
+    @pytest.fixture
+    def mocked_response(
+        self, request: pytest.FixtureRequest, mocked_get: AsyncMock
+    ) -> AsyncMock:
+        """Make mocked_get return the sample XML fixture named by the parameter."""
+        mocked_get.return_value = request.getfixturevalue(request.param)
+        return mocked_get
+
+    @pytest.fixture(scope="module")
+    def parsed_gl_market_document(
+        self, valid_gl_market_document_xml: str
+    ) -> GlMarketDocument:
+        """GL_MarketDocument sample parsed once per module."""
+        return GlMarketDocument.from_xml(valid_gl_market_document_xml)
+
+    @pytest.fixture(scope="module")
+    def parsed_no_data_acknowledgement(
+        self, no_data_acknowledgement_xml: str
+    ) -> AcknowledgementMarketDocument:
+        """No-data acknowledgement sample parsed once per module."""
+        return AcknowledgementMarketDocument.from_xml(no_data_acknowledgement_xml)
+
+    @pytest.fixture(scope="module")
+    def parsed_error_acknowledgement(
+        self, error_acknowledgement_xml: str
+    ) -> AcknowledgementMarketDocument:
+        """Error acknowledgement sample parsed once per module."""
+        return AcknowledgementMarketDocument.from_xml(error_acknowledgement_xml)
+
     def test_xml_document_detector_integration(
         self,
         valid_gl_market_document_xml: str,
@@ -135,13 +215,13 @@ class TestAcknowledgementDocumentIntegration:
         assert ack_error_type == XmlDocumentType.ACKNOWLEDGEMENT_MARKET_DOCUMENT
 
     def test_acknowledgement_document_parsing_integration(
-        self, no_data_acknowledgement_xml: str, error_acknowledgement_xml: str
+        self,
+        parsed_no_data_acknowledgement: AcknowledgementMarketDocument,
+        parsed_error_acknowledgement: AcknowledgementMarketDocument,
     ) -> None:
         """Test AcknowledgementMarketDocument parsing and classification."""
         # Test no-data acknowledgement parsing
-        no_data_doc = AcknowledgementMarketDocument.from_xml(
-            no_data_acknowledgement_xml
-        )
+        no_data_doc = parsed_no_data_acknowledgement
         assert no_data_doc.mRID == "ack-no-data-id"
         assert no_data_doc.reason_code == "999"
         assert no_data_doc.is_no_data_available() is True
@@ -149,7 +229,7 @@ class TestAcknowledgementDocumentIntegration:
         assert "No matching data found" in no_data_doc.reason_text
 
         # Test error acknowledgement parsing
-        error_doc = AcknowledgementMarketDocument.from_xml(error_acknowledgement_xml)
+        error_doc = parsed_error_acknowledgement
         assert error_doc.mRID == "ack-error-id"
         assert error_doc.reason_code == "401"
         assert error_doc.is_no_data_available() is False
@@ -157,10 +237,10 @@ class TestAcknowledgementDocumentIntegration:
         assert "Unauthorized access" in error_doc.reason_text
 
     def test_gl_market_document_parsing_integration(
-        self, valid_gl_market_document_xml: str
+        self, parsed_gl_market_document: GlMarketDocument
     ) -> None:
         """Test GL_MarketDocument parsing still works correctly."""
-        gl_doc = GlMarketDocument.from_xml(valid_gl_market_document_xml)
+        gl_doc = parsed_gl_market_document
         assert gl_doc.mRID == "sample-gl-document-id"
         assert gl_doc.timeSeries[0].mRID == "ts-sample-id"
         assert len(gl_doc.timeSeries[0].period.points) == 2
@@ -169,115 +249,115 @@ class TestAcknowledgementDocumentIntegration:
 
     @pytest.mark.asyncio
     async def test_client_workflow_with_gl_market_document(
-        self, client_with_mock: DefaultEntsoEClient, valid_gl_market_document_xml: str
+        self,
+        client_with_mock: DefaultEntsoEClient,
+        mocked_get: AsyncMock,
+        utc_now: datetime,
+        valid_gl_market_document_xml: str,
     ) -> None:
         """Test complete client workflow when ENTSO-E returns GL_MarketDocument."""
         # Mock the HTTP client get method to return GL_MarketDocument XML
-        with patch.object(
-            client_with_mock.http_client, "get", new_callable=AsyncMock
-        ) as mock_get:
-            mock_get.return_value = valid_gl_market_document_xml
-
-            # Test period - yesterday for actual data
-            today = datetime.now(UTC).date()
-            yesterday = today - timedelta(days=1)
-            period_start = datetime.combine(yesterday, datetime.min.time()).replace(
-                tzinfo=UTC
-            )
-            period_end = period_start + timedelta(days=1)
-
-            # Make request
-            result = await client_with_mock.get_actual_total_load(
-                bidding_zone=AreaCode.CZECH_REPUBLIC,
-                period_start=period_start,
-                period_end=period_end,
-            )
-
-            # Verify result
-            assert isinstance(result, GlMarketDocument)
-            assert result.mRID == "sample-gl-document-id"
-            assert result.timeSeries[0].mRID == "ts-sample-id"
-            assert len(result.timeSeries[0].period.points) == 2
-
-            # Verify HTTP client was called
-            mock_get.assert_called_once()
+        mocked_get.return_value = valid_gl_market_document_xml
+
+        # Test period - yesterday for actual data
+        period_start = utc_now - timedelta(days=1)
+        period_end = period_start + timedelta(days=1)
+
+        # Make request
+        result = await client_with_mock.get_actual_total_load(
+            bidding_zone=AreaCode.CZECH_REPUBLIC,
+            period_start=period_start,
+            period_end=period_end,
+        )
+
+        # Verify result
+        assert isinstance(result, GlMarketDocument)
+        assert result.mRID == "sample-gl-document-id"
+        assert result.timeSeries[0].mRID == "ts-sample-id"
+        assert len(result.timeSeries[0].period.points) == 2
+
+        # Verify HTTP client was called
+        mocked_get.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_client_workflow_with_no_data_acknowledgement(
-        self, client_with_mock: DefaultEntsoEClient, no_data_acknowledgement_xml: str
+        self,
+        client_with_mock: DefaultEntsoEClient,
+        mocked_get: AsyncMock,
+        utc_now: datetime,
+        no_data_acknowledgement_xml: str,
     ) -> None:
         """Test complete client workflow when ENTSO-E returns no-data acknowledgement."""
         # Mock the HTTP client get method to return acknowledgement XML
-        with patch.object(
-            client_with_mock.http_client, "get", new_callable=AsyncMock
-        ) as mock_get:
-            mock_get.return_value = no_data_acknowledgement_xml
-
-            # Test period - future date that likely has no data
-            tomorrow = datetime.now(UTC).date() + timedelta(days=1)
-            period_start = datetime.combine(tomorrow, datetime.min.time()).replace(
-                tzinfo=UTC
-            )
-            period_end = period_start + timedelta(days=1)
-
-            # Make request - should return None for no-data acknowledgement
-            result = await client_with_mock.get_year_ahead_forecast_margin(
-                bidding_zone=AreaCode.CZECH_REPUBLIC,
-                period_start=period_start,
-                period_end=period_end,
-            )
-
-            # Phase 2 implementation: should return None for no-data acknowledgements
-            assert result is None
-
-            # Verify that the acknowledgement was properly detected and parsed
-            xml_response = no_data_acknowledgement_xml
-            doc_type = XmlDocumentDetector.detect_document_type(xml_response)
-            assert doc_type == XmlDocumentType.ACKNOWLEDGEMENT_MARKET_DOCUMENT
-
-            ack_doc = AcknowledgementMarketDocument.from_xml(xml_response)
-            assert ack_doc.is_no_data_available() is True
-            assert ack_doc.reason_code == "999"
-
-            # Note: Not verifying HTTP client was called since client may fail before HTTP request
-            # This will be properly tested in Phase 2 when client handles acknowledgements
+        mocked_get.return_value = no_data_acknowledgement_xml
+
+        # Test period - future date that likely has no data
+        period_start = utc_now + timedelta(days=1)
+        period_end = period_start + timedelta(days=1)
+
+        # Make request - should return None for no-data acknowledgement
+        result = await client_with_mock.get_year_ahead_forecast_margin(
+            bidding_zone=AreaCode.CZECH_REPUBLIC,
+            period_start=period_start,
+            period_end=period_end,
+        )
+
+        # No-data acknowledgements are reported as a None result
+        assert result is None
+        mocked_get.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_client_workflow_with_error_acknowledgement(
-        self, client_with_mock: DefaultEntsoEClient, error_acknowledgement_xml: str
+        self,
+        client_with_mock: DefaultEntsoEClient,
+        mocked_get: AsyncMock,
+        utc_now: datetime,
+        error_acknowledgement_xml: str,
     ) -> None:
         """Test complete client workflow when ENTSO-E returns error acknowledgement."""
         # Mock the HTTP client get method to return error acknowledgement XML
-        with patch.object(
-            client_with_mock.http_client, "get", new_callable=AsyncMock
-        ) as mock_get:
-            mock_get.return_value = error_acknowledgement_xml
-
-            period_start = datetime.now(UTC)
-            period_end = period_start + timedelta(days=1)
+        mocked_get.return_value = error_acknowledgement_xml
 
-            # Make request - should handle error acknowledgement appropriately
-            result = await client_with_mock.get_actual_total_load(
-                bidding_zone=AreaCode.CZECH_REPUBLIC,
-                period_start=period_start,
-                period_end=period_end,
-            )
+        period_start = utc_now
+        period_end = period_start + timedelta(days=1)
 
-            # Phase 2 implementation: should return None for error acknowledgements too
-            assert result is None
+        # Make request - should handle error acknowledgement appropriately
+        result = await client_with_mock.get_actual_total_load(
+            bidding_zone=AreaCode.CZECH_REPUBLIC,
+            period_start=period_start,
+            period_end=period_end,
+        )
 
-            # Verify that the error acknowledgement was properly detected and parsed
-            xml_response = error_acknowledgement_xml
-            doc_type = XmlDocumentDetector.detect_document_type(xml_response)
-            assert doc_type == XmlDocumentType.ACKNOWLEDGEMENT_MARKET_DOCUMENT
+        # Error acknowledgements are logged and also reported as a None result
+        assert result is None
+        mocked_get.assert_called_once()
 
-            ack_doc = AcknowledgementMarketDocument.from_xml(xml_response)
-            assert ack_doc.is_error_acknowledgement() is True
-            assert ack_doc.reason_code == "401"
-            assert "Unauthorized access" in ack_doc.reason_text
+    def test_no_data_acknowledgement_is_detected(
+        self,
+        no_data_acknowledgement_xml: str,
+        parsed_no_data_acknowledgement: AcknowledgementMarketDocument,
+    ) -> None:
+        """Test the no-data acknowledgement is detected and classified as no data."""
+        _assert_acknowledgement_detected(
+            no_data_acknowledgement_xml,
+            parsed_no_data_acknowledgement,
+            AcknowledgementMarketDocument.is_no_data_available,
+            "999",
+        )
 
-            # Note: Not verifying HTTP client was called since client may fail before HTTP request
-            # This will be properly tested in Phase 2 when client handles acknowledgements
+    def test_error_acknowledgement_is_detected(
+        self,
+        error_acknowledgement_xml: str,
+        parsed_error_acknowledgement: AcknowledgementMarketDocument,
+    ) -> None:
+        """Test the error acknowledgement is detected and classified as an error."""
+        ack_doc = _assert_acknowledgement_detected(
+            error_acknowledgement_xml,
+            parsed_error_acknowledgement,
+            AcknowledgementMarketDocument.is_error_acknowledgement,
+            "401",
+        )
+        assert "Unauthorized access" in ack_doc.reason_text
 
     def test_complete_workflow_simulation(
         self,
@@ -286,16 +366,16 @@ class TestAcknowledgementDocumentIntegration:
         error_acknowledgement_xml: str,
     ) -> None:
         """Simulate complete workflow without client dependency."""
-        test_responses = [
+        test_responses = (
             valid_gl_market_document_xml,
             no_data_acknowledgement_xml,
             error_acknowledgement_xml,
-        ]
+        )
 
         results = []
         for xml_response in test_responses:
             # Step 1: Detect document type
-            doc_type = XmlDocumentDetector.detect_document_type(xml_response)
+            doc_type = _detect_document_type(xml_response)
 
             # Step 2: Parse based on document type
             if doc_type == XmlDocumentType.GL_MARKET_DOCUMENT:
@@ -327,45 +407,41 @@ class TestAcknowledgementDocumentIntegration:
         assert results[2][1].reason_code == "401"
 
     @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("mocked_response", "client_method", "assert_result"),
+        [
+            pytest.param(
+                "valid_gl_market_document_xml",
+                "get_actual_total_load",
+                _assert_gl_market_document_result,
+                id="gl-market-document",
+            ),
+            pytest.param(
+                "no_data_acknowledgement_xml",
+                "get_year_ahead_forecast_margin",
+                _assert_no_data_result,
+                id="no-data-acknowledgement",
+            ),
+        ],
+        indirect=["mocked_response"],
+    )
     async def test_mixed_response_scenarios(
         self,
         client_with_mock: DefaultEntsoEClient,
-        valid_gl_market_document_xml: str,
-        no_data_acknowledgement_xml: str,
+        mocked_response: AsyncMock,
+        utc_now: datetime,
+        client_method: str,
+        assert_result: Callable[[GlMarketDocument | None], None],
     ) -> None:
-        """Test handling of mixed response scenarios in sequence."""
-        responses = [valid_gl_market_document_xml, no_data_acknowledgement_xml]
-
-        for i, xml_response in enumerate(responses):
-            with patch.object(
-                client_with_mock.http_client, "get", new_callable=AsyncMock
-            ) as mock_get:
-                mock_get.return_value = xml_response
-
-                period_start = datetime.now(UTC) + timedelta(days=i)
-                period_end = period_start + timedelta(days=1)
-
-                if i == 0:  # GL_MarketDocument response
-                    result = await client_with_mock.get_actual_total_load(
-                        bidding_zone=AreaCode.CZECH_REPUBLIC,
-                        period_start=period_start,
-                        period_end=period_end,
-                    )
-                    assert isinstance(result, GlMarketDocument)
-                    assert result.mRID == "sample-gl-document-id"
-                else:  # Acknowledgement response
-                    result = await client_with_mock.get_year_ahead_forecast_margin(
-                        bidding_zone=AreaCode.CZECH_REPUBLIC,
-                        period_start=period_start,
-                        period_end=period_end,
-                    )
-
-                    # Phase 2 implementation: should return None for acknowledgements
-                    assert result is None
-
-                    # Verify we can still detect and parse acknowledgement
-                    doc_type = XmlDocumentDetector.detect_document_type(xml_response)
-                    assert doc_type == XmlDocumentType.ACKNOWLEDGEMENT_MARKET_DOCUMENT
-
-                    ack_doc = AcknowledgementMarketDocument.from_xml(xml_response)
-                    assert ack_doc.is_no_data_available() is True
+        """Test that each response type is routed to the right client outcome."""
+        period_start = utc_now
+        period_end = period_start + timedelta(days=1)
+
+        result = await getattr(client_with_mock, client_method)(
+            bidding_zone=AreaCode.CZECH_REPUBLIC,
+            period_start=period_start,
+            period_end=period_end,
+        )
+
+        assert_result(result)
+        mocked_response.assert_called_once()
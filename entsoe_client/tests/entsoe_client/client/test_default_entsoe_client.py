@@ -1,10 +1,16 @@
 """Unit tests for DefaultEntsoEClient."""
 
+import asyncio
+from collections.abc import Iterator
+from dataclasses import dataclass
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock, Mock, patch
+from typing import Any, NamedTuple
+from unittest.mock import Mock, patch, sentinel
 
 import pytest
+from pydantic import HttpUrl
 
+import entsoe_client.client.default_entsoe_client as default_entsoe_client_module
 from entsoe_client.client.default_entsoe_client import DefaultEntsoEClient
 from entsoe_client.client.entsoe_client_error import EntsoEClientError
 from entsoe_client.http_client.exceptions import HttpClientError
@@ -13,239 +19,258 @@ from entsoe_client.model.common.area_code import AreaCode
 from entsoe_client.model.common.document_type import DocumentType
 from entsoe_client.model.common.process_type import ProcessType
 from entsoe_client.model.load.gl_market_document import GlMarketDocument
-from entsoe_client.model.market.publication_market_document import (
-    PublicationMarketDocument,
+
+
+class ValidParams(NamedTuple):
+    """Bidding zone and period shared by the load method tests."""
+
+    bidding_zone: AreaCode
+    start: datetime
+    end: datetime
+
+
+VALID_PARAMS = ValidParams(
+    bidding_zone=AreaCode.CZECH_REPUBLIC,
+    start=datetime(2024, 1, 1, tzinfo=UTC),
+    end=datetime(2024, 1, 31, tzinfo=UTC),
 )
 
+# Query parameters every load request for VALID_PARAMS carries; the period end
+# is rounded up to the next quarter hour.
+VALID_PERIOD_PARAMS = {
+    "outBiddingZone_Domain": VALID_PARAMS.bidding_zone.code,
+    "periodStart": "202401010000",
+    "periodEnd": "202401310015",
+}
+
+
+class LoadMethodCase(NamedTuple):
+    """A load client method with the request it is expected to build."""
+
+    method_name: str
+    build_method_name: str
+    expected_params: dict[str, str]
+
+
+LOAD_METHOD_CASES = [
+    LoadMethodCase(
+        "get_actual_total_load",
+        "build_actual_total_load",
+        {
+            "documentType": DocumentType.SYSTEM_TOTAL_LOAD.code,
+            "processType": ProcessType.REALISED.code,
+            **VALID_PERIOD_PARAMS,
+        },
+    ),
+    LoadMethodCase(
+        "get_day_ahead_load_forecast",
+        "build_day_ahead_load_forecast",
+        {
+            "documentType": DocumentType.SYSTEM_TOTAL_LOAD.code,
+            "processType": ProcessType.DAY_AHEAD.code,
+            **VALID_PERIOD_PARAMS,
+        },
+    ),
+    LoadMethodCase(
+        "get_week_ahead_load_forecast",
+        "build_week_ahead_load_forecast",
+        {
+            "documentType": DocumentType.SYSTEM_TOTAL_LOAD.code,
+            "processType": ProcessType.WEEK_AHEAD.code,
+            **VALID_PERIOD_PARAMS,
+        },
+    ),
+    LoadMethodCase(
+        "get_month_ahead_load_forecast",
+        "build_month_ahead_load_forecast",
+        {
+            "documentType": DocumentType.SYSTEM_TOTAL_LOAD.code,
+            "processType": ProcessType.MONTH_AHEAD.code,
+            **VALID_PERIOD_PARAMS,
+        },
+    ),
+    LoadMethodCase(
+        "get_year_ahead_load_forecast",
+        "build_year_ahead_load_forecast",
+        {
+            "documentType": DocumentType.SYSTEM_TOTAL_LOAD.code,
+            "processType": ProcessType.YEAR_AHEAD.code,
+            **VALID_PERIOD_PARAMS,
+        },
+    ),
+    LoadMethodCase(
+        "get_year_ahead_forecast_margin",
+        "build_year_ahead_forecast_margin",
+        {
+            "documentType": DocumentType.LOAD_FORECAST_MARGIN.code,
+            "processType": ProcessType.YEAR_AHEAD.code,
+            **VALID_PERIOD_PARAMS,
+        },
+    ),
+]
+
+
+@dataclass(frozen=True, slots=True)
+class FakeDocument:
+    """Immutable stand-in for a parsed document returned by the client."""
+
+    mRID: str = "TEST_ID"
+
+
+class StubHttpClient(HttpClient):
+    """In-memory HttpClient that records calls instead of performing requests."""
+
+    def __init__(self, response: str = "<xml>mock response</xml>") -> None:
+        self.response = response
+        self.get_side_effect: Exception | None = None
+        self.get_calls: list[tuple[HttpUrl, dict[str, Any] | None]] = []
+        self.close_calls = 0
+
+    def reset(self) -> None:
+        """Clear recorded calls and any configured side effect."""
+        self.get_side_effect = None
+        self.get_calls.clear()
+        self.close_calls = 0
+
+    async def get(self, url: HttpUrl, params: dict[str, Any] | None = None) -> str:
+        self.get_calls.append((url, params))
+        if self.get_side_effect is not None:
+            raise self.get_side_effect
+        return self.response
+
+    async def close(self) -> None:
+        self.close_calls += 1
+
 
 class TestDefaultEntsoEClient:
     """Test suite for DefaultEntsoEClient."""
 
-    @pytest.fixture
-    def mock_http_client(self) -> AsyncMock:
-        """Create a mock HTTP client."""
-        mock_client = AsyncMock(spec=HttpClient)
-        mock_client.get = AsyncMock(return_value="<xml>mock response</xml>")
-        mock_client.close = AsyncMock()
-        return mock_client
-
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def base_url(self) -> str:
         """Base URL for testing."""
         return "https://web-api.tp.entsoe.eu/api"
 
-    @pytest.fixture
-    def client(self, mock_http_client: AsyncMock, base_url: str) -> DefaultEntsoEClient:
-        """Create a DefaultEntsoEClient instance for testing."""
-        return DefaultEntsoEClient(mock_http_client, base_url)
+    @pytest.fixture(scope="module")
+    def shared_client(
+        self, base_url: str
+    ) -> tuple[DefaultEntsoEClient, StubHttpClient]:
+        """Create one client and stub HTTP client for the whole module."""
+        stub = StubHttpClient()
+        return DefaultEntsoEClient(stub, base_url), stub
 
     @pytest.fixture
-    def valid_bidding_zone(self) -> AreaCode:
-        """Valid bidding zone for testing."""
-        return AreaCode.CZECH_REPUBLIC
+    def mock_http_client(
+        self, shared_client: tuple[DefaultEntsoEClient, StubHttpClient]
+    ) -> StubHttpClient:
+        """Return the shared stub HTTP client with its recorded state cleared."""
+        _, stub = shared_client
+        stub.reset()
+        return stub
 
     @pytest.fixture
-    def valid_start_date(self) -> datetime:
-        """Valid start date for testing."""
-        return datetime(2024, 1, 1, tzinfo=UTC)
+    def client(
+        self, shared_client: tuple[DefaultEntsoEClient, StubHttpClient]
+    ) -> DefaultEntsoEClient:
+        """Return the shared DefaultEntsoEClient, backed by a freshly reset stub."""
+        client, stub = shared_client
+        stub.reset()
+        return client
+
+    @pytest.fixture(scope="session")
+    def valid_params(self) -> ValidParams:
+        """Valid bidding zone and period for testing."""
+        return VALID_PARAMS
+
+    @pytest.fixture(scope="session")
+    def mock_gl_market_document(self) -> FakeDocument:
+        """Stand-in for a parsed GlMarketDocument."""
+        return FakeDocument()
+
+    @pytest.fixture(scope="session")
+    def mock_publication_market_document(self) -> FakeDocument:
+        """Stand-in for a parsed PublicationMarketDocument."""
+        return FakeDocument()
 
     @pytest.fixture
-    def valid_end_date(self) -> datetime:
-        """Valid end date for testing."""
-        return datetime(2024, 1, 31, tzinfo=UTC)
-
-    @pytest.fixture
-    def mock_gl_market_document(self) -> GlMarketDocument:
-        """Create a mock GlMarketDocument."""
-        mock_doc = Mock(spec=GlMarketDocument)
-        mock_doc.mRID = "TEST_ID"
-        return mock_doc
-
-    @pytest.fixture
-    def mock_publication_market_document(self) -> PublicationMarketDocument:
-        """Create a mock PublicationMarketDocument."""
-        mock_doc = Mock(spec=PublicationMarketDocument)
-        mock_doc.mRID = "TEST_ID"
-        return mock_doc
-
-    def test_init(self, mock_http_client: AsyncMock, base_url: str) -> None:
-        """Test DefaultEntsoEClient initialization."""
-        client = DefaultEntsoEClient(mock_http_client, base_url)
-
-        assert client.http_client == mock_http_client
-        assert client.base_url == base_url
-
-    @pytest.mark.asyncio
-    async def test_get_actual_total_load_success(
-        self,
-        client: DefaultEntsoEClient,
-        valid_bidding_zone: AreaCode,
-        valid_start_date: datetime,
-        valid_end_date: datetime,
-        mock_gl_market_document: GlMarketDocument,
-    ) -> None:
-        """Test successful actual total load retrieval."""
-        with patch.object(
-            client,
-            "_execute_request",
-            return_value=mock_gl_market_document,
-        ):
-            result = await client.get_actual_total_load(
-                bidding_zone=valid_bidding_zone,
-                period_start=valid_start_date,
-                period_end=valid_end_date,
-            )
-
-            assert result == mock_gl_market_document
-
-    @pytest.mark.asyncio
-    async def test_get_actual_total_load_with_offset(
-        self,
-        client: DefaultEntsoEClient,
-        valid_bidding_zone: AreaCode,
-        valid_start_date: datetime,
-        valid_end_date: datetime,
-        mock_gl_market_document: GlMarketDocument,
-    ) -> None:
-        """Test actual total load retrieval with offset parameter."""
-        offset = 100
-
-        with patch.object(
-            client,
-            "_execute_request",
-            return_value=mock_gl_market_document,
-        ):
-            result = await client.get_actual_total_load(
-                bidding_zone=valid_bidding_zone,
-                period_start=valid_start_date,
-                period_end=valid_end_date,
-                offset=offset,
-            )
-
-            assert result == mock_gl_market_document
-
-    @pytest.mark.asyncio
-    async def test_get_day_ahead_load_forecast_success(
-        self,
-        client: DefaultEntsoEClient,
-        valid_bidding_zone: AreaCode,
-        valid_start_date: datetime,
-        valid_end_date: datetime,
-        mock_gl_market_document: GlMarketDocument,
-    ) -> None:
-        """Test successful day-ahead load forecast retrieval."""
-        with patch.object(
-            client,
-            "_execute_request",
-            return_value=mock_gl_market_document,
-        ):
-            result = await client.get_day_ahead_load_forecast(
-                bidding_zone=valid_bidding_zone,
-                period_start=valid_start_date,
-                period_end=valid_end_date,
-            )
-
-            assert result == mock_gl_market_document
-
-    @pytest.mark.asyncio
-    async def test_get_week_ahead_load_forecast_success(
+    def patched_client(
         self,
         client: DefaultEntsoEClient,
-        valid_bidding_zone: AreaCode,
-        valid_start_date: datetime,
-        valid_end_date: datetime,
-        mock_gl_market_document: GlMarketDocument,
-    ) -> None:
-        """Test successful week-ahead load forecast retrieval."""
+        mock_gl_market_document: FakeDocument,
+    ) -> Iterator[tuple[DefaultEntsoEClient, Mock]]:
+        """Yield the client with _execute_request patched to return the mock document."""
         with patch.object(
             client,
             "_execute_request",
             return_value=mock_gl_market_document,
-        ):
-            result = await client.get_week_ahead_load_forecast(
-                bidding_zone=valid_bidding_zone,
-                period_start=valid_start_date,
-                period_end=valid_end_date,
-            )
-
-            assert result == mock_gl_market_document
+        ) as mock_execute:
+            yield client, mock_execute
 
-    @pytest.mark.asyncio
-    async def test_get_month_ahead_load_forecast_success(
-        self,
-        client: DefaultEntsoEClient,
-        valid_bidding_zone: AreaCode,
-        valid_start_date: datetime,
-        valid_end_date: datetime,
-        mock_gl_market_document: GlMarketDocument,
-    ) -> None:
-        """Test successful month-ahead load forecast retrieval."""
-        with patch.object(
-            client,
-            "_execute_request",
-            return_value=mock_gl_market_document,
-        ):
-            result = await client.get_month_ahead_load_forecast(
-                bidding_zone=valid_bidding_zone,
-                period_start=valid_start_date,
-                period_end=valid_end_date,
-            )
+    @pytest.fixture
+    def mock_builder_class(self, monkeypatch: pytest.MonkeyPatch) -> Mock:
+        """Replace LoadDomainRequestBuilder in the client module with a Mock."""
+        mock_builder_class = Mock()
+        monkeypatch.setattr(
+            default_entsoe_client_module, "LoadDomainRequestBuilder", mock_builder_class
+        )
+        return mock_builder_class
+
+    def test_init(self, mock_http_client: StubHttpClient, base_url: str) -> None:
+        """Test DefaultEntsoEClient initialization."""
+        client = DefaultEntsoEClient(mock_http_client, base_url)
 
-            assert result == mock_gl_market_document
+        assert client.http_client is mock_http_client
+        assert client.base_url == base_url
 
+    @pytest.mark.parametrize("case", LOAD_METHOD_CASES, ids=lambda c: c.method_name)
     @pytest.mark.asyncio
-    async def test_get_year_ahead_load_forecast_success(
+    async def test_get_load_document_success(
         self,
-        client: DefaultEntsoEClient,
-        valid_bidding_zone: AreaCode,
-        valid_start_date: datetime,
-        valid_end_date: datetime,
-        mock_gl_market_document: GlMarketDocument,
+        patched_client: tuple[DefaultEntsoEClient, Mock],
+        valid_params: ValidParams,
+        case: LoadMethodCase,
     ) -> None:
-        """Test successful year-ahead load forecast retrieval."""
-        with patch.object(
-            client,
-            "_execute_request",
-            return_value=mock_gl_market_document,
-        ):
-            result = await client.get_year_ahead_load_forecast(
-                bidding_zone=valid_bidding_zone,
-                period_start=valid_start_date,
-                period_end=valid_end_date,
-            )
-
-            assert result == mock_gl_market_document
+        """Test each load method builds the expected request and returns its result."""
+        client, mock_execute_request = patched_client
+        result = await getattr(client, case.method_name)(
+            bidding_zone=valid_params.bidding_zone,
+            period_start=valid_params.start,
+            period_end=valid_params.end,
+        )
+
+        assert result is mock_execute_request.return_value
+        request = mock_execute_request.call_args.args[0]
+        assert request.to_parameter_map() == case.expected_params
 
     @pytest.mark.asyncio
-    async def test_get_year_ahead_forecast_margin_success(
+    async def test_get_actual_total_load_with_offset(
         self,
-        client: DefaultEntsoEClient,
-        valid_bidding_zone: AreaCode,
-        valid_start_date: datetime,
-        valid_end_date: datetime,
-        mock_gl_market_document: GlMarketDocument,
+        patched_client: tuple[DefaultEntsoEClient, Mock],
+        valid_params: ValidParams,
+        mock_gl_market_document: FakeDocument,
     ) -> None:
-        """Test successful year-ahead forecast margin retrieval."""
-        with patch.object(
-            client,
-            "_execute_request",
-            return_value=mock_gl_market_document,
-        ):
-            result = await client.get_year_ahead_forecast_margin(
-                bidding_zone=valid_bidding_zone,
-                period_start=valid_start_date,
-                period_end=valid_end_date,
-            )
-
-            assert result == mock_gl_market_document
+        """Test actual total load retrieval with offset parameter."""
+        client, mock_execute_request = patched_client
+
+        result = await client.get_actual_total_load(
+            bidding_zone=valid_params.bidding_zone,
+            period_start=valid_params.start,
+            period_end=valid_params.end,
+            offset=100,
+        )
+
+        assert result is mock_gl_market_document
+        request = mock_execute_request.call_args.args[0]
+        assert request.to_parameter_map() == {
+            **LOAD_METHOD_CASES[0].expected_params,
+            "offset": "100",
+        }
 
     @pytest.mark.asyncio
     async def test_get_physical_flows_success(
         self,
         client: DefaultEntsoEClient,
-        valid_start_date: datetime,
-        valid_end_date: datetime,
-        mock_publication_market_document: PublicationMarketDocument,
+        valid_params: ValidParams,
+        mock_publication_market_document: FakeDocument,
     ) -> None:
         """Test successful physical flows retrieval."""
         with patch.object(
@@ -256,322 +281,209 @@ class TestDefaultEntsoEClient:
             result = await client.get_physical_flows(
                 in_domain=AreaCode.CZECH_REPUBLIC,
                 out_domain=AreaCode.SLOVAKIA,
-                period_start=valid_start_date,
-                period_end=valid_end_date,
+                period_start=valid_params.start,
+                period_end=valid_params.end,
             )
 
-            assert result == mock_publication_market_document
+            assert result is mock_publication_market_document
 
     @pytest.mark.asyncio
     async def test_execute_request_http_error(
         self,
         client: DefaultEntsoEClient,
-        mock_http_client: AsyncMock,
-        valid_bidding_zone: AreaCode,
-        valid_start_date: datetime,
-        valid_end_date: datetime,
+        mock_http_client: StubHttpClient,
+        valid_params: ValidParams,
     ) -> None:
         """Test _execute_request handles HTTP client errors."""
         http_error = HttpClientError("Connection failed")
-        mock_http_client.get.side_effect = http_error
+        mock_http_client.get_side_effect = http_error
 
         with pytest.raises(EntsoEClientError) as exc_info:
             await client.get_actual_total_load(
-                bidding_zone=valid_bidding_zone,
-                period_start=valid_start_date,
-                period_end=valid_end_date,
+                bidding_zone=valid_params.bidding_zone,
+                period_start=valid_params.start,
+                period_end=valid_params.end,
             )
 
         assert "Failed to fetch load data" in str(exc_info.value)
-        assert exc_info.value.cause == http_error
+        assert exc_info.value.cause is http_error
 
     @pytest.mark.asyncio
     async def test_execute_request_xml_parsing_error(
         self,
         client: DefaultEntsoEClient,
-        valid_bidding_zone: AreaCode,
-        valid_start_date: datetime,
-        valid_end_date: datetime,
+        valid_params: ValidParams,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test _execute_request handles XML parsing errors."""
         xml_error = Exception("Invalid XML")
+        monkeypatch.setattr(
+            default_entsoe_client_module.XmlDocumentDetector,
+            "detect_document_type",
+            Mock(side_effect=xml_error),
+        )
 
-        with patch(
-            "entsoe_client.client.default_entsoe_client.XmlDocumentDetector.detect_document_type",
-            side_effect=xml_error,
-        ):
-            with pytest.raises(EntsoEClientError) as exc_info:
-                await client.get_actual_total_load(
-                    bidding_zone=valid_bidding_zone,
-                    period_start=valid_start_date,
-                    period_end=valid_end_date,
-                )
+        with pytest.raises(EntsoEClientError) as exc_info:
+            await client.get_actual_total_load(
+                bidding_zone=valid_params.bidding_zone,
+                period_start=valid_params.start,
+                period_end=valid_params.end,
+            )
 
-            assert "Failed to parse XML response" in str(exc_info.value)
-            assert exc_info.value.cause == xml_error
+        assert "Failed to parse XML response" in str(exc_info.value)
+        assert exc_info.value.cause is xml_error
 
-    @pytest.mark.asyncio
-    async def test_parse_xml_response_success(
+    def test_parse_xml_response_success(
         self,
         client: DefaultEntsoEClient,
-        mock_gl_market_document: GlMarketDocument,
+        mock_gl_market_document: FakeDocument,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test _parse_xml_response successfully parses XML."""
         xml_content = "<xml>test content</xml>"
+        mock_from_xml = Mock(return_value=mock_gl_market_document)
+        monkeypatch.setattr(GlMarketDocument, "from_xml", mock_from_xml)
 
-        with patch.object(
-            GlMarketDocument,
-            "from_xml",
-            return_value=mock_gl_market_document,
-        ) as mock_from_xml:
-            result = client._parse_xml_response(xml_content)
+        result = client._parse_xml_response(xml_content)
 
-            assert result == mock_gl_market_document
-            mock_from_xml.assert_called_once_with(xml_content)
+        assert result is mock_gl_market_document
+        mock_from_xml.assert_called_once_with(xml_content)
 
-    @pytest.mark.asyncio
-    async def test_parse_xml_response_raises_exception(
+    def test_parse_xml_response_raises_exception(
         self,
         client: DefaultEntsoEClient,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test _parse_xml_response raises exceptions properly."""
         xml_content = "<invalid>xml</invalid>"
         xml_error = Exception("Parse error")
+        monkeypatch.setattr(GlMarketDocument, "from_xml", Mock(side_effect=xml_error))
 
-        with patch.object(GlMarketDocument, "from_xml", side_effect=xml_error):
-            with pytest.raises(Exception, match="Parse error") as exc_info:
-                client._parse_xml_response(xml_content)
+        with pytest.raises(Exception, match="Parse error") as exc_info:
+            client._parse_xml_response(xml_content)
 
-            assert exc_info.value == xml_error
+        assert exc_info.value is xml_error
 
+    @pytest.mark.parametrize(
+        "http_client_fixture", ["mock_http_client", None], ids=["stub", "none"]
+    )
     @pytest.mark.asyncio
-    async def test_close_calls_http_client_close(
-        self,
-        client: DefaultEntsoEClient,
-        mock_http_client: AsyncMock,
-    ) -> None:
-        """Test close() method calls HTTP client close."""
-        await client.close()
-        mock_http_client.close.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_close_handles_none_http_client(
+    async def test_close(
         self,
+        request: pytest.FixtureRequest,
         base_url: str,
+        http_client_fixture: str | None,
     ) -> None:
-        """Test close() method handles None HTTP client gracefully."""
-        client = DefaultEntsoEClient(None, base_url)
+        """Test close() closes the HTTP client and tolerates a missing one."""
+        http_client = (
+            request.getfixturevalue(http_client_fixture)
+            if http_client_fixture
+            else None
+        )
+        client = DefaultEntsoEClient(http_client, base_url)
 
-        # Should not raise an exception
         await client.close()
 
+        if http_client is not None:
+            assert http_client.close_calls == 1
+
     @pytest.mark.asyncio
     async def test_async_context_manager(
         self,
         client: DefaultEntsoEClient,
-        mock_http_client: AsyncMock,
+        mock_http_client: StubHttpClient,
     ) -> None:
         """Test async context manager functionality."""
         async with client as ctx_client:
             assert ctx_client is client
 
         # Verify close was called on exit
-        mock_http_client.close.assert_called_once()
+        assert mock_http_client.close_calls == 1
 
     @pytest.mark.asyncio
     async def test_all_methods_use_execute_request(
         self,
-        client: DefaultEntsoEClient,
-        valid_bidding_zone: AreaCode,
-        valid_start_date: datetime,
-        valid_end_date: datetime,
-        mock_gl_market_document: GlMarketDocument,
+        patched_client: tuple[DefaultEntsoEClient, Mock],
+        valid_params: ValidParams,
     ) -> None:
         """Test all public methods use _execute_request internally."""
-        with patch.object(
-            client,
-            "_execute_request",
-            return_value=mock_gl_market_document,
-        ) as mock_execute:
-            # Test all methods
-            await client.get_actual_total_load(
-                valid_bidding_zone,
-                valid_start_date,
-                valid_end_date,
-            )
-            await client.get_day_ahead_load_forecast(
-                valid_bidding_zone,
-                valid_start_date,
-                valid_end_date,
-            )
-            await client.get_week_ahead_load_forecast(
-                valid_bidding_zone,
-                valid_start_date,
-                valid_end_date,
-            )
-            await client.get_month_ahead_load_forecast(
-                valid_bidding_zone,
-                valid_start_date,
-                valid_end_date,
-            )
-            await client.get_year_ahead_load_forecast(
-                valid_bidding_zone,
-                valid_start_date,
-                valid_end_date,
-            )
-            await client.get_year_ahead_forecast_margin(
-                valid_bidding_zone,
-                valid_start_date,
-                valid_end_date,
-            )
+        client, mock_execute = patched_client
+
+        await asyncio.gather(
+            client.get_actual_total_load(*valid_params),
+            client.get_day_ahead_load_forecast(*valid_params),
+            client.get_week_ahead_load_forecast(*valid_params),
+            client.get_month_ahead_load_forecast(*valid_params),
+            client.get_year_ahead_load_forecast(*valid_params),
+            client.get_year_ahead_forecast_margin(*valid_params),
+        )
 
-            # Verify _execute_request was called 6 times
-            assert mock_execute.call_count == 6
+        # Verify _execute_request was called 6 times
+        assert mock_execute.call_count == 6
 
     @pytest.mark.asyncio
     async def test_logging_calls_in_methods(
         self,
-        client: DefaultEntsoEClient,
-        valid_bidding_zone: AreaCode,
-        valid_start_date: datetime,
-        valid_end_date: datetime,
-        mock_gl_market_document: GlMarketDocument,
+        patched_client: tuple[DefaultEntsoEClient, Mock],
+        valid_params: ValidParams,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test that logging calls are made in all methods."""
-        with (
-            patch.object(
-                client,
-                "_execute_request",
-                return_value=mock_gl_market_document,
-            ),
-            patch(
-                "entsoe_client.client.default_entsoe_client.logger",
-            ) as mock_logger,
-        ):
-            await client.get_actual_total_load(
-                valid_bidding_zone,
-                valid_start_date,
-                valid_end_date,
-            )
+        client, _ = patched_client
+        mock_logger = Mock()
+        monkeypatch.setattr(default_entsoe_client_module, "logger", mock_logger)
+
+        await client.get_actual_total_load(*valid_params)
 
-            # Verify debug logging was called
-            mock_logger.debug.assert_called_once()
-            call_args = mock_logger.debug.call_args[0]
-            assert "Fetching actual total load" in call_args[0]
-            assert valid_bidding_zone.code in call_args
+        # Verify debug logging was called
+        mock_logger.debug.assert_called_once()
+        call_args = mock_logger.debug.call_args[0]
+        assert "Fetching actual total load" in call_args[0]
+        assert valid_params.bidding_zone.code in call_args
 
     @pytest.mark.asyncio
     async def test_request_builder_parameters(
         self,
-        client: DefaultEntsoEClient,
-        valid_bidding_zone: AreaCode,
-        valid_start_date: datetime,
-        valid_end_date: datetime,
-        mock_gl_market_document: GlMarketDocument,
+        patched_client: tuple[DefaultEntsoEClient, Mock],
+        valid_params: ValidParams,
+        mock_builder_class: Mock,
     ) -> None:
         """Test that LoadDomainRequestBuilder is called with correct parameters."""
+        client, mock_execute = patched_client
         offset = 500
-
-        with (
-            patch.object(
-                client,
-                "_execute_request",
-                return_value=mock_gl_market_document,
-            ),
-            patch(
-                "entsoe_client.client.default_entsoe_client.LoadDomainRequestBuilder",
-            ) as mock_builder_class,
-        ):
-            mock_builder = Mock()
-            mock_builder.build_actual_total_load.return_value = Mock()
-            mock_builder_class.return_value = mock_builder
-
-            await client.get_actual_total_load(
-                bidding_zone=valid_bidding_zone,
-                period_start=valid_start_date,
-                period_end=valid_end_date,
-                offset=offset,
-            )
-
-            # Verify LoadDomainRequestBuilder was called with correct parameters
-            mock_builder_class.assert_called_once_with(
-                out_bidding_zone_domain=valid_bidding_zone,
-                period_start=valid_start_date,
-                period_end=valid_end_date,
-                offset=offset,
-            )
-            mock_builder.build_actual_total_load.assert_called_once()
-
+        mock_builder = mock_builder_class.return_value
+        mock_builder.build_actual_total_load.return_value = sentinel.request
+
+        await client.get_actual_total_load(
+            bidding_zone=valid_params.bidding_zone,
+            period_start=valid_params.start,
+            period_end=valid_params.end,
+            offset=offset,
+        )
+
+        # Verify LoadDomainRequestBuilder was called with correct parameters
+        mock_builder_class.assert_called_once_with(
+            out_bidding_zone_domain=valid_params.bidding_zone,
+            period_start=valid_params.start,
+            period_end=valid_params.end,
+            offset=offset,
+        )
+        mock_builder.build_actual_total_load.assert_called_once()
+        mock_execute.assert_called_once_with(sentinel.request)
+
+    @pytest.mark.parametrize("case", LOAD_METHOD_CASES, ids=lambda c: c.method_name)
     @pytest.mark.asyncio
     async def test_different_build_methods_called(
         self,
-        client: DefaultEntsoEClient,
-        valid_bidding_zone: AreaCode,
-        valid_start_date: datetime,
-        valid_end_date: datetime,
-        mock_gl_market_document: GlMarketDocument,
+        patched_client: tuple[DefaultEntsoEClient, Mock],
+        valid_params: ValidParams,
+        mock_builder_class: Mock,
+        case: LoadMethodCase,
     ) -> None:
-        """Test that different methods call corresponding build methods."""
-        with (
-            patch.object(
-                client,
-                "_execute_request",
-                return_value=mock_gl_market_document,
-            ),
-            patch(
-                "entsoe_client.client.default_entsoe_client.LoadDomainRequestBuilder",
-            ) as mock_builder_class,
-        ):
-            mock_builder = Mock()
-            mock_builder_class.return_value = mock_builder
-
-            # Set up return values for all build methods
-            mock_builder.build_actual_total_load.return_value = Mock()
-            mock_builder.build_day_ahead_load_forecast.return_value = Mock()
-            mock_builder.build_week_ahead_load_forecast.return_value = Mock()
-            mock_builder.build_month_ahead_load_forecast.return_value = Mock()
-            mock_builder.build_year_ahead_load_forecast.return_value = Mock()
-            mock_builder.build_year_ahead_forecast_margin.return_value = Mock()
-
-            # Test each method calls corresponding build method
-            await client.get_actual_total_load(
-                valid_bidding_zone,
-                valid_start_date,
-                valid_end_date,
-            )
-            mock_builder.build_actual_total_load.assert_called_once()
+        """Test that each method calls its corresponding build method."""
+        client, _ = patched_client
 
-            await client.get_day_ahead_load_forecast(
-                valid_bidding_zone,
-                valid_start_date,
-                valid_end_date,
-            )
-            mock_builder.build_day_ahead_load_forecast.assert_called_once()
+        await getattr(client, case.method_name)(*valid_params)
 
-            await client.get_week_ahead_load_forecast(
-                valid_bidding_zone,
-                valid_start_date,
-                valid_end_date,
-            )
-            mock_builder.build_week_ahead_load_forecast.assert_called_once()
-
-            await client.get_month_ahead_load_forecast(
-                valid_bidding_zone,
-                valid_start_date,
-                valid_end_date,
-            )
-            mock_builder.build_month_ahead_load_forecast.assert_called_once()
-
-            await client.get_year_ahead_load_forecast(
-                valid_bidding_zone,
-                valid_start_date,
-                valid_end_date,
-            )
-            mock_builder.build_year_ahead_load_forecast.assert_called_once()
-
-            await client.get_year_ahead_forecast_margin(
-                valid_bidding_zone,
-                valid_start_date,
-                valid_end_date,
-            )
-            mock_builder.build_year_ahead_forecast_margin.assert_called_once()
+        mock_builder = mock_builder_class.return_value
+        getattr(mock_builder, case.build_method_name).assert_called_once()
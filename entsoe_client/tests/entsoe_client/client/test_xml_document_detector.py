@@ -6,24 +6,14 @@ from entsoe_client.client.xml_document_detector import (
 )
 from entsoe_client.exceptions.entsoe_api_request_error import EntsoEApiRequestError
 
-
-class TestXmlDocumentDetector:
-    """Test suite for XmlDocumentDetector XML document type detection."""
-
-    @pytest.fixture
-    def gl_market_document_xml(self) -> str:
-        """Sample GL_MarketDocument XML."""
-        return """<?xml version="1.0" encoding="UTF-8"?>
+GL_MARKET_DOCUMENT_XML = """<?xml version="1.0" encoding="UTF-8"?>
 <GL_MarketDocument xmlns="urn:iec62325.351:tc57wg16:451-6:generationloaddocument:3:0">
     <mRID>sample-id</mRID>
     <type>A65</type>
     <!-- Additional content -->
 </GL_MarketDocument>"""
 
-    @pytest.fixture
-    def acknowledgement_document_xml(self) -> str:
-        """Sample Acknowledgement_MarketDocument XML."""
-        return """<?xml version="1.0" encoding="UTF-8"?>
+ACKNOWLEDGEMENT_DOCUMENT_XML = """<?xml version="1.0" encoding="UTF-8"?>
 <Acknowledgement_MarketDocument xmlns="urn:iec62325.351:tc57wg16:451-1:acknowledgementdocument:7:0">
     <mRID>ack-id</mRID>
     <Reason>
@@ -32,207 +22,237 @@ class TestXmlDocumentDetector:
     </Reason>
 </Acknowledgement_MarketDocument>"""
 
-    @pytest.fixture
-    def minimal_gl_document_xml(self) -> str:
-        """Minimal GL_MarketDocument XML."""
-        return "<GL_MarketDocument></GL_MarketDocument>"
+MINIMAL_GL_DOCUMENT_XML = "<GL_MarketDocument></GL_MarketDocument>"
+
+MINIMAL_ACKNOWLEDGEMENT_XML = (
+    "<Acknowledgement_MarketDocument></Acknowledgement_MarketDocument>"
+)
+
+XML_WITH_DECLARATION_AND_WHITESPACE = """  <?xml version="1.0" encoding="UTF-8"?>
+
+    <GL_MarketDocument xmlns="urn:iec62325.351:tc57wg16:451-6:generationloaddocument:3:0">
+        <content/>
+    </GL_MarketDocument>  """
 
-    @pytest.fixture
-    def minimal_acknowledgement_xml(self) -> str:
-        """Minimal Acknowledgement_MarketDocument XML."""
-        return "<Acknowledgement_MarketDocument></Acknowledgement_MarketDocument>"
+XML_WITH_ROOT_ATTRIBUTES = """<GL_MarketDocument xmlns="urn:namespace" version="1.0" id="test">
+    <content/>
+</GL_MarketDocument>"""
+
+XML_WITH_BYTE_ORDER_MARK = '\ufeff<?xml version="1.0" encoding="UTF-8"?><GL_MarketDocument></GL_MarketDocument>'
+
+XML_WITH_DOCTYPE_INTERNAL_SUBSET = """<!DOCTYPE GL_MarketDocument [
+    <!ENTITY a 'b'>
+]>
+<GL_MarketDocument></GL_MarketDocument>"""
+
+XML_WITH_SELF_CLOSING_ROOT = '<Acknowledgement_MarketDocument xmlns="urn:namespace" />'
+
+XML_WITH_COMMENTS_BEFORE_ROOT = """<?xml version="1.0" encoding="UTF-8"?>
+<!-- This is a comment -->
+<!-- Another comment -->
+<GL_MarketDocument>
+    <content/>
+</GL_MarketDocument>"""
+
+XML_WITH_PROCESSING_INSTRUCTIONS = """<?xml version="1.0" encoding="UTF-8"?>
+<?xml-stylesheet type="text/xsl" href="style.xsl"?>
+<Acknowledgement_MarketDocument>
+    <content/>
+</Acknowledgement_MarketDocument>"""
 
-    def test_detect_gl_market_document(self, gl_market_document_xml: str) -> None:
+XML_WITH_CDATA_SECTIONS = """<GL_MarketDocument>
+    <![CDATA[This is CDATA content]]>
+    <content/>
+</GL_MarketDocument>"""
+
+XML_WITH_MARKUP_IN_LEADING_COMMENT = """<?xml version="1.0" encoding="UTF-8"?>
+<!-- <UnknownDocument attribute="value"> -->
+<!DOCTYPE GL_MarketDocument>
+<GL_MarketDocument/>"""
+
+
+class TestXmlDocumentDetector:
+    """Test suite for XmlDocumentDetector XML document type detection."""
+
+    def test_detect_gl_market_document(self) -> None:
         """Test detection of GL_MarketDocument type."""
         # Act
-        document_type = XmlDocumentDetector.detect_document_type(gl_market_document_xml)
+        document_type = XmlDocumentDetector.detect_document_type(GL_MARKET_DOCUMENT_XML)
 
         # Assert
         assert document_type == XmlDocumentType.GL_MARKET_DOCUMENT
 
-    def test_detect_acknowledgement_document(
-        self, acknowledgement_document_xml: str
-    ) -> None:
+    def test_detect_acknowledgement_document(self) -> None:
         """Test detection of Acknowledgement_MarketDocument type."""
         # Act
         document_type = XmlDocumentDetector.detect_document_type(
-            acknowledgement_document_xml
+            ACKNOWLEDGEMENT_DOCUMENT_XML
         )
 
         # Assert
         assert document_type == XmlDocumentType.ACKNOWLEDGEMENT_MARKET_DOCUMENT
 
-    def test_detect_minimal_gl_document(self, minimal_gl_document_xml: str) -> None:
+    def test_detect_minimal_gl_document(self) -> None:
         """Test detection with minimal GL_MarketDocument."""
         # Act
         document_type = XmlDocumentDetector.detect_document_type(
-            minimal_gl_document_xml
+            MINIMAL_GL_DOCUMENT_XML
         )
 
         # Assert
         assert document_type == XmlDocumentType.GL_MARKET_DOCUMENT
 
-    def test_detect_minimal_acknowledgement_document(
-        self, minimal_acknowledgement_xml: str
-    ) -> None:
+    def test_detect_minimal_acknowledgement_document(self) -> None:
         """Test detection with minimal Acknowledgement_MarketDocument."""
         # Act
         document_type = XmlDocumentDetector.detect_document_type(
-            minimal_acknowledgement_xml
+            MINIMAL_ACKNOWLEDGEMENT_XML
         )
 
         # Assert
         assert document_type == XmlDocumentType.ACKNOWLEDGEMENT_MARKET_DOCUMENT
 
-    def test_detect_with_xml_declaration_and_whitespace(self) -> None:
-        """Test detection with XML declaration and various whitespace."""
-        # Arrange
-        xml_with_whitespace = """  <?xml version="1.0" encoding="UTF-8"?>
-
-        <GL_MarketDocument xmlns="urn:iec62325.351:tc57wg16:451-6:generationloaddocument:3:0">
-            <content/>
-        </GL_MarketDocument>  """
-
-        # Act
-        document_type = XmlDocumentDetector.detect_document_type(xml_with_whitespace)
-
-        # Assert
-        assert document_type == XmlDocumentType.GL_MARKET_DOCUMENT
-
-    def test_detect_with_attributes_in_root_element(self) -> None:
-        """Test detection when root element has attributes."""
-        # Arrange
-        xml_with_attributes = """<GL_MarketDocument xmlns="urn:namespace" version="1.0" id="test">
-            <content/>
-        </GL_MarketDocument>"""
-
-        # Act
-        document_type = XmlDocumentDetector.detect_document_type(xml_with_attributes)
-
-        # Assert
-        assert document_type == XmlDocumentType.GL_MARKET_DOCUMENT
-
-    def test_detect_with_self_closing_root_element(self) -> None:
-        """Test detection with self-closing root element."""
-        # Arrange
-        self_closing_xml = '<Acknowledgement_MarketDocument xmlns="urn:namespace" />'
-
-        # Act
-        document_type = XmlDocumentDetector.detect_document_type(self_closing_xml)
-
-        # Assert
-        assert document_type == XmlDocumentType.ACKNOWLEDGEMENT_MARKET_DOCUMENT
-
     def test_detect_empty_string_raises_exception(self) -> None:
         """Test that empty string raises EntsoEApiRequestError."""
         # Act & Assert
-        with pytest.raises(EntsoEApiRequestError) as exc_info:
+        with pytest.raises(
+            EntsoEApiRequestError, match="XML content is empty or invalid"
+        ):
             XmlDocumentDetector.detect_document_type("")
 
-        assert "XML content is empty or invalid" in str(exc_info.value)
-
     def test_detect_none_input_raises_exception(self) -> None:
         """Test that None input raises EntsoEApiRequestError."""
         # Act & Assert
-        with pytest.raises(EntsoEApiRequestError) as exc_info:
+        with pytest.raises(
+            EntsoEApiRequestError, match="XML content is empty or invalid"
+        ):
             XmlDocumentDetector.detect_document_type(None)  # type: ignore[arg-type]
 
-        assert "XML content is empty or invalid" in str(exc_info.value)
-
     def test_detect_non_string_input_raises_exception(self) -> None:
         """Test that non-string input raises EntsoEApiRequestError."""
         # Act & Assert
-        with pytest.raises(EntsoEApiRequestError) as exc_info:
+        with pytest.raises(
+            EntsoEApiRequestError, match="XML content is empty or invalid"
+        ):
             XmlDocumentDetector.detect_document_type(123)  # type: ignore[arg-type]
 
-        assert "XML content is empty or invalid" in str(exc_info.value)
-
     def test_detect_whitespace_only_raises_exception(self) -> None:
         """Test that whitespace-only string raises EntsoEApiRequestError."""
         # Act & Assert
-        with pytest.raises(EntsoEApiRequestError) as exc_info:
+        with pytest.raises(EntsoEApiRequestError, match="No XML root element found"):
             XmlDocumentDetector.detect_document_type("   \n\t   ")
 
-        assert "No XML root element found" in str(exc_info.value)
-
     def test_detect_no_xml_elements_raises_exception(self) -> None:
         """Test that string without XML elements raises EntsoEApiRequestError."""
         # Act & Assert
-        with pytest.raises(EntsoEApiRequestError) as exc_info:
+        with pytest.raises(EntsoEApiRequestError, match="No XML root element found"):
             XmlDocumentDetector.detect_document_type("This is not XML content")
 
-        assert "No XML root element found" in str(exc_info.value)
-
     def test_detect_unknown_document_type_raises_exception(self) -> None:
         """Test that unknown document type raises EntsoEApiRequestError."""
         # Arrange
         unknown_xml = "<UnknownDocument><content/></UnknownDocument>"
 
         # Act & Assert
-        with pytest.raises(EntsoEApiRequestError) as exc_info:
+        with pytest.raises(
+            EntsoEApiRequestError,
+            match="Unsupported XML document type: UnknownDocument",
+        ):
             XmlDocumentDetector.detect_document_type(unknown_xml)
 
-        assert "Unsupported XML document type: UnknownDocument" in str(exc_info.value)
-
     def test_detect_malformed_xml_raises_exception(self) -> None:
         """Test that malformed XML raises EntsoEApiRequestError."""
         # Arrange
         malformed_xml = "<GL_MarketDocument<invalid"
 
         # Act & Assert
-        with pytest.raises(EntsoEApiRequestError) as exc_info:
+        with pytest.raises(EntsoEApiRequestError, match="No XML root element found"):
             XmlDocumentDetector.detect_document_type(malformed_xml)
 
-        assert "No XML root element found" in str(exc_info.value)
-
-    def test_detect_xml_with_comments_before_root(self) -> None:
-        """Test detection with XML comments before root element."""
-        # Arrange
-        xml_with_comments = """<?xml version="1.0" encoding="UTF-8"?>
-        <!-- This is a comment -->
-        <!-- Another comment -->
-        <GL_MarketDocument>
-            <content/>
-        </GL_MarketDocument>"""
-
-        # Act
-        document_type = XmlDocumentDetector.detect_document_type(xml_with_comments)
-
-        # Assert
-        assert document_type == XmlDocumentType.GL_MARKET_DOCUMENT
-
-    def test_detect_xml_with_processing_instructions(self) -> None:
-        """Test detection with XML processing instructions."""
-        # Arrange
-        xml_with_pi = """<?xml version="1.0" encoding="UTF-8"?>
-        <?xml-stylesheet type="text/xsl" href="style.xsl"?>
-        <Acknowledgement_MarketDocument>
-            <content/>
-        </Acknowledgement_MarketDocument>"""
-
-        # Act
-        document_type = XmlDocumentDetector.detect_document_type(xml_with_pi)
-
-        # Assert
-        assert document_type == XmlDocumentType.ACKNOWLEDGEMENT_MARKET_DOCUMENT
-
     @pytest.mark.parametrize(
-        ("root_element", "expected_type"),
+        ("xml", "expected_type"),
         [
-            ("GL_MarketDocument", XmlDocumentType.GL_MARKET_DOCUMENT),
-            (
-                "Acknowledgement_MarketDocument",
+            pytest.param(
+                MINIMAL_GL_DOCUMENT_XML,
+                XmlDocumentType.GL_MARKET_DOCUMENT,
+                id="minimal-gl",
+            ),
+            pytest.param(
+                MINIMAL_ACKNOWLEDGEMENT_XML,
                 XmlDocumentType.ACKNOWLEDGEMENT_MARKET_DOCUMENT,
+                id="minimal-acknowledgement",
+            ),
+            pytest.param(
+                "<Publication_MarketDocument></Publication_MarketDocument>",
+                XmlDocumentType.PUBLICATION_MARKET_DOCUMENT,
+                id="minimal-publication",
+            ),
+            pytest.param(
+                XML_WITH_DECLARATION_AND_WHITESPACE,
+                XmlDocumentType.GL_MARKET_DOCUMENT,
+                id="declaration-and-whitespace",
+            ),
+            pytest.param(
+                XML_WITH_ROOT_ATTRIBUTES,
+                XmlDocumentType.GL_MARKET_DOCUMENT,
+                id="root-attributes",
+            ),
+            pytest.param(
+                XML_WITH_SELF_CLOSING_ROOT,
+                XmlDocumentType.ACKNOWLEDGEMENT_MARKET_DOCUMENT,
+                id="self-closing-root",
+            ),
+            pytest.param(
+                XML_WITH_COMMENTS_BEFORE_ROOT,
+                XmlDocumentType.GL_MARKET_DOCUMENT,
+                id="comments-before-root",
+            ),
+            pytest.param(
+                XML_WITH_PROCESSING_INSTRUCTIONS,
+                XmlDocumentType.ACKNOWLEDGEMENT_MARKET_DOCUMENT,
+                id="processing-instructions",
+            ),
+            pytest.param(
+                XML_WITH_CDATA_SECTIONS,
+                XmlDocumentType.GL_MARKET_DOCUMENT,
+                id="cdata-sections",
+            ),
+            pytest.param(
+                XML_WITH_MARKUP_IN_LEADING_COMMENT,
+                XmlDocumentType.GL_MARKET_DOCUMENT,
+                id="markup-in-leading-comment",
+            ),
+            pytest.param(
+                XML_WITH_BYTE_ORDER_MARK,
+                XmlDocumentType.GL_MARKET_DOCUMENT,
+                id="byte-order-mark",
+            ),
+            pytest.param(
+                XML_WITH_BYTE_ORDER_MARK.encode(),
+                XmlDocumentType.GL_MARKET_DOCUMENT,
+                id="byte-order-mark-bytes",
+            ),
+            pytest.param(
+                XML_WITH_DOCTYPE_INTERNAL_SUBSET,
+                XmlDocumentType.GL_MARKET_DOCUMENT,
+                id="doctype-internal-subset",
+            ),
+            pytest.param(
+                "< GL_MarketDocument></GL_MarketDocument>",
+                XmlDocumentType.GL_MARKET_DOCUMENT,
+                id="whitespace-after-tag-open",
+            ),
+            pytest.param(
+                "leading text\n<Publication_MarketDocument></Publication_MarketDocument>",
+                XmlDocumentType.PUBLICATION_MARKET_DOCUMENT,
+                id="leading-text",
             ),
         ],
     )
     def test_detect_document_type_parametrized(
-        self, root_element: str, expected_type: XmlDocumentType
+        self, xml: str | bytes, expected_type: XmlDocumentType
     ) -> None:
-        """Test document type detection with parametrized root elements."""
-        # Arrange
-        xml = f"<{root_element}></{root_element}>"
-
+        """Test document type detection across root and prolog variants."""
         # Act
         document_type = XmlDocumentDetector.detect_document_type(xml)
 
@@ -251,19 +271,15 @@ class TestXmlDocumentDetector:
         # Assert
         assert document_type == XmlDocumentType.GL_MARKET_DOCUMENT
 
-    def test_detect_xml_with_cdata_sections(self) -> None:
-        """Test detection with CDATA sections in XML."""
+    def test_detect_root_beyond_scan_limit_raises_exception(self) -> None:
+        """Test that a root element past the scan window is not searched for."""
         # Arrange
-        xml_with_cdata = """<GL_MarketDocument>
-            <![CDATA[This is CDATA content]]>
-            <content/>
-        </GL_MarketDocument>"""
+        padding = "<!--" + "x" * XmlDocumentDetector.SCAN_LIMIT + "-->"
+        xml = f"{padding}<GL_MarketDocument></GL_MarketDocument>"
 
-        # Act
-        document_type = XmlDocumentDetector.detect_document_type(xml_with_cdata)
-
-        # Assert
-        assert document_type == XmlDocumentType.GL_MARKET_DOCUMENT
+        # Act & Assert
+        with pytest.raises(EntsoEApiRequestError, match="No XML root element found"):
+            XmlDocumentDetector.detect_document_type(xml)
 
     def test_detect_xml_with_namespaced_root_element(self) -> None:
         """Test detection with namespaced root element."""
@@ -273,29 +289,80 @@ class TestXmlDocumentDetector:
         </ns:GL_MarketDocument>"""
 
         # Act & Assert - This should raise exception as we don't expect namespaced roots
-        with pytest.raises(EntsoEApiRequestError) as exc_info:
+        with pytest.raises(
+            EntsoEApiRequestError,
+            match="Unsupported XML document type: ns:GL_MarketDocument",
+        ):
             XmlDocumentDetector.detect_document_type(namespaced_xml)
 
-        assert "Unsupported XML document type: ns:GL_MarketDocument" in str(
-            exc_info.value
-        )
+    def test_detect_unterminated_comment_raises_exception(self) -> None:
+        """Test that an unterminated comment before the root is rejected."""
+        # Act & Assert
+        with pytest.raises(EntsoEApiRequestError, match="No XML root element found"):
+            XmlDocumentDetector.detect_document_type("<!-- <GL_MarketDocument>")
 
-    def test_regex_pattern_compilation(self) -> None:
-        """Test that the regex pattern is properly compiled."""
-        # Assert
-        assert XmlDocumentDetector.ROOT_ELEMENT_PATTERN is not None
-        assert hasattr(XmlDocumentDetector.ROOT_ELEMENT_PATTERN, "search")
+    @pytest.mark.parametrize(
+        "xml",
+        ["<GL_MarketDocumentExtended/>", "<GL_MarketDocument"],
+        ids=["longer-name", "unterminated-tag"],
+    )
+    def test_detect_supported_prefix_without_terminator(self, xml: str) -> None:
+        """Test that a supported root name prefix alone is not accepted."""
+        # Act & Assert
+        with pytest.raises(EntsoEApiRequestError):
+            XmlDocumentDetector.detect_document_type(xml)
+
+    @pytest.mark.parametrize(
+        "content_type",
+        [bytes, bytearray, memoryview],
+        ids=["bytes", "bytearray", "memoryview"],
+    )
+    def test_detect_undecoded_content(
+        self,
+        content_type: type[bytes | bytearray | memoryview],
+    ) -> None:
+        """Test detection on the undecoded response body."""
+        # Arrange
+        xml_content = content_type(GL_MARKET_DOCUMENT_XML.encode())
+
+        # Act
+        document_type = XmlDocumentDetector.detect_document_type(xml_content)
 
-    def test_enum_values(self) -> None:
-        """Test that XmlDocumentType enum has expected values."""
         # Assert
-        assert XmlDocumentType.GL_MARKET_DOCUMENT.value == "GL_MarketDocument"
-        assert (
-            XmlDocumentType.PUBLICATION_MARKET_DOCUMENT.value
-            == "Publication_MarketDocument"
-        )
-        assert (
-            XmlDocumentType.ACKNOWLEDGEMENT_MARKET_DOCUMENT.value
-            == "Acknowledgement_MarketDocument"
-        )
-        assert len(XmlDocumentType) == 3
+        assert document_type == XmlDocumentType.GL_MARKET_DOCUMENT
+
+    def test_detect_empty_bytes_raises_exception(self) -> None:
+        """Test that empty bytes raise EntsoEApiRequestError."""
+        # Act & Assert
+        with pytest.raises(
+            EntsoEApiRequestError, match="XML content is empty or invalid"
+        ):
+            XmlDocumentDetector.detect_document_type(b"")
+
+    @pytest.mark.parametrize(
+        ("xml_content", "expected_offset"),
+        [
+            (b"<GL_MarketDocument/>", 0),
+            (b' \r\n<?xml version="1.0"?>\n<Root/>', 25),
+            (b"<!-- a -- b -->\t<!DOCTYPE Root><Root/>", 31),
+            (b"<!DOCTYPE Root [<!ENTITY a 'b'>]><Root/>", 33),
+            (b"text <Root/>", 5),
+            (b"<?xml version", -1),
+            (b"<!DOCTYPE Root [<!ENTITY a 'b'>", -1),
+        ],
+        ids=[
+            "no-prolog",
+            "declaration",
+            "comment-and-doctype",
+            "doctype-internal-subset",
+            "leading-text",
+            "unterminated",
+            "unterminated-internal-subset",
+        ],
+    )
+    def test_skip_prolog_offsets(
+        self, xml_content: bytes, expected_offset: int
+    ) -> None:
+        """Test that _skip_prolog lands on the root start tag."""
+        # Act & Assert
+        assert XmlDocumentDetector._skip_prolog(xml_content) == expected_offset
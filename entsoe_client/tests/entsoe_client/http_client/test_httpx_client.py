@@ -1,5 +1,6 @@
 import asyncio
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterator
+from dataclasses import dataclass
 from datetime import timedelta
 from http import HTTPStatus
 from typing import Any
@@ -20,16 +21,76 @@ from entsoe_client.http_client.exceptions import (
 from entsoe_client.http_client.httpx_client import HttpxClient
 from entsoe_client.http_client.retry_handler import RetryHandler
 
+API_TOKEN = SecretStr("test-token")
+BASE_URL = HttpUrl("https://api.example.com")
+DATA_URL = HttpUrl("https://api.example.com/data")
+
+
+@dataclass(frozen=True, slots=True)
+class FakeResponse:
+    """Stand-in for httpx.Response exposing only what HttpxClient reads."""
+
+    status_code: int
+    text: str
+
+
+async def _passthrough(func: Callable[[], Awaitable[Any]]) -> Any:
+    """Run the operation once, standing in for RetryHandler.execute."""
+    return await func()
+
+
+ERROR_PATH_CASES = [
+    pytest.param(
+        503, HttpClientRetryError, "Request failed with status 503", id="retryable"
+    ),
+    pytest.param(
+        400, HttpClientError, "Request failed with status 400", id="non-retryable"
+    ),
+    pytest.param(
+        httpx.TimeoutException("Request timeout"),
+        HttpClientTimeoutError,
+        "Request timeout",
+        id="timeout",
+    ),
+    pytest.param(
+        httpx.ConnectError("Connection failed"),
+        HttpClientConnectionError,
+        "Connection failed",
+        id="connection",
+    ),
+    pytest.param(
+        httpx.RemoteProtocolError("Server disconnected without sending a response."),
+        HttpClientConnectionError,
+        "Server disconnected without sending a response",
+        id="remote-protocol",
+    ),
+    pytest.param(
+        httpx.HTTPStatusError(
+            "Status error", request=MagicMock(), response=MagicMock()
+        ),
+        HttpClientError,
+        "HTTP status error",
+        id="http-status",
+    ),
+    pytest.param(
+        httpx.RequestError("Generic request error"),
+        HttpClientError,
+        "Request failed",
+        id="request",
+    ),
+    pytest.param(None, HttpClientError, "Client not initialized", id="no-client"),
+]
+
 
 class TestHttpxClient:
     """Test cases for HttpxClient class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_config(self) -> EntsoEClientConfig:
-        """Create a mock ENTSO-E client configuration."""
+        """Create a mock ENTSO-E client configuration shared by the module."""
         return EntsoEClientConfig(
-            api_token=SecretStr("test-token"),
-            base_url=HttpUrl("https://api.example.com"),
+            api_token=API_TOKEN,
+            base_url=BASE_URL,
             user_agent="test-agent",
             http=HttpConfig(
                 connection_timeout=timedelta(seconds=10),
@@ -38,6 +99,7 @@ class TestHttpxClient:
                 pool_timeout=timedelta(seconds=15),
                 max_connections=50,
                 max_keepalive_connections=10,
+                keepalive_expiry=timedelta(seconds=45),
             ),
             retry=RetryConfig(max_attempts=3),
         )
@@ -46,11 +108,7 @@ class TestHttpxClient:
     def mock_retry_handler(self) -> AsyncMock:
         """Create a mock retry handler."""
         handler = AsyncMock(spec=RetryHandler)
-
-        async def execute_mock(func: Callable[[], Awaitable[Any]]) -> Any:
-            return await func()
-
-        handler.execute = AsyncMock(side_effect=execute_mock)
+        handler.execute = AsyncMock(side_effect=_passthrough)
         return handler
 
     @pytest.fixture
@@ -58,28 +116,28 @@ class TestHttpxClient:
         self,
         mock_config: EntsoEClientConfig,
         mock_retry_handler: AsyncMock,
-    ) -> HttpxClient:
-        """Create an HttpxClient instance for testing."""
-        return HttpxClient(mock_config, mock_retry_handler)
+    ) -> Iterator[HttpxClient]:
+        """Create an HttpxClient instance that never opens a real connection.
+
+        Tests assign ``_client`` directly; any client left behind is dropped
+        at teardown.
+        """
+        client = HttpxClient(mock_config, mock_retry_handler)
+        client._ensure_client = AsyncMock()  # type: ignore[method-assign]
+        yield client
+        client._client = None
 
     @pytest.mark.asyncio
     async def test_context_manager_lifecycle(self, httpx_client: HttpxClient) -> None:
         """Test async context manager entry and exit."""
-        with (
-            patch.object(
-                httpx_client,
-                "_ensure_client",
-                new_callable=AsyncMock,
-            ) as mock_ensure,
-            patch.object(
-                httpx_client,
-                "close",
-                new_callable=AsyncMock,
-            ) as mock_close,
-        ):
+        with patch.object(
+            httpx_client,
+            "close",
+            new_callable=AsyncMock,
+        ) as mock_close:
             async with httpx_client as client:
                 assert client is httpx_client
-                mock_ensure.assert_called_once()
+                httpx_client._ensure_client.assert_called_once()  # type: ignore[attr-defined]
             mock_close.assert_called_once()
 
     @pytest.mark.asyncio
@@ -89,7 +147,7 @@ class TestHttpxClient:
     ) -> None:
         """Test that _ensure_client creates an httpx.AsyncClient with proper configuration."""
         with patch("httpx.AsyncClient") as mock_client_class:
-            await httpx_client._ensure_client()
+            await HttpxClient._ensure_client(httpx_client)
 
             mock_client_class.assert_called_once()
             call_args = mock_client_class.call_args
@@ -98,6 +156,7 @@ class TestHttpxClient:
             limits = call_args.kwargs["limits"]
             assert limits.max_connections == 50
             assert limits.max_keepalive_connections == 10
+            assert limits.keepalive_expiry == 45.0
 
             # Check timeout configuration
             timeout = call_args.kwargs["timeout"]
@@ -116,8 +175,8 @@ class TestHttpxClient:
             mock_client_instance = AsyncMock()
             mock_client_class.return_value = mock_client_instance
 
-            await httpx_client._ensure_client()
-            await httpx_client._ensure_client()
+            await HttpxClient._ensure_client(httpx_client)
+            await HttpxClient._ensure_client(httpx_client)
 
             # Should only be called once
             mock_client_class.assert_called_once()
@@ -129,24 +188,21 @@ class TestHttpxClient:
         mock_retry_handler: AsyncMock,
     ) -> None:
         """Test successful GET request."""
-        mock_response = MagicMock()
-        mock_response.status_code = HTTPStatus.OK
-        mock_response.text = "<xml>response</xml>"
+        mock_response = FakeResponse(HTTPStatus.OK, "<xml>response</xml>")
 
         mock_client = AsyncMock()
         mock_client.get.return_value = mock_response
 
-        with patch.object(httpx_client, "_ensure_client", new_callable=AsyncMock):
-            httpx_client._client = mock_client
+        httpx_client._client = mock_client
 
-            result = await httpx_client.get(
-                HttpUrl("https://api.example.com/data"),
-                {"param1": "value1", "param2": "value2"},
-            )
+        result = await httpx_client.get(
+            DATA_URL,
+            {"param1": "value1", "param2": "value2"},
+        )
 
-            assert result == "<xml>response</xml>"
-            mock_retry_handler.execute.assert_called_once()
-            mock_client.get.assert_called_once()
+        assert result == "<xml>response</xml>"
+        mock_retry_handler.execute.assert_called_once()
+        mock_client.get.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_get_adds_security_token(
@@ -154,27 +210,24 @@ class TestHttpxClient:
         httpx_client: HttpxClient,
     ) -> None:
         """Test that GET request adds security token from config."""
-        mock_response = MagicMock()
-        mock_response.status_code = HTTPStatus.OK
-        mock_response.text = "response"
+        mock_response = FakeResponse(HTTPStatus.OK, "response")
 
         mock_client = AsyncMock()
         mock_client.get.return_value = mock_response
 
-        with patch.object(httpx_client, "_ensure_client", new_callable=AsyncMock):
-            httpx_client._client = mock_client
+        httpx_client._client = mock_client
 
-            await httpx_client.get(HttpUrl("https://api.example.com/data"))
+        await httpx_client.get(DATA_URL)
 
-            # Check that the URL contains the security token
-            call_args = mock_client.get.call_args
-            called_url = call_args[0][0]
+        # Check that the URL contains the security token
+        call_args = mock_client.get.call_args
+        called_url = call_args[0][0]
 
-            parsed_url = urlparse(called_url)
-            query_params = parse_qs(parsed_url.query)
+        parsed_url = urlparse(called_url)
+        query_params = parse_qs(parsed_url.query)
 
-            assert "securityToken" in query_params
-            assert query_params["securityToken"] == ["test-token"]
+        assert "securityToken" in query_params
+        assert query_params["securityToken"] == ["test-token"]
 
     @pytest.mark.asyncio
     async def test_get_adds_headers(
@@ -182,187 +235,59 @@ class TestHttpxClient:
         httpx_client: HttpxClient,
     ) -> None:
         """Test that GET request adds headers from config."""
-        mock_response = MagicMock()
-        mock_response.status_code = HTTPStatus.OK
-        mock_response.text = "response"
-
-        mock_client = AsyncMock()
-        mock_client.get.return_value = mock_response
-
-        with patch.object(httpx_client, "_ensure_client", new_callable=AsyncMock):
-            httpx_client._client = mock_client
-
-            await httpx_client.get(HttpUrl("https://api.example.com/data"))
-
-            # Check that headers are passed
-            call_args = mock_client.get.call_args
-            headers = call_args.kwargs.get("headers", {})
-
-            assert headers.get("User-Agent") == "test-agent"
-
-    @pytest.mark.asyncio
-    async def test_get_retryable_error(
-        self,
-        httpx_client: HttpxClient,
-        mock_retry_handler: AsyncMock,
-    ) -> None:
-        """Test that retryable HTTP errors are handled correctly."""
-        mock_response = MagicMock()
-        mock_response.status_code = 503
-        mock_response.text = "Service Unavailable"
-
-        mock_client = AsyncMock()
-        mock_client.get.return_value = mock_response
-
-        with patch.object(httpx_client, "_ensure_client", new_callable=AsyncMock):
-            httpx_client._client = mock_client
-
-            # Mock retry handler to execute once and raise the exception
-            async def execute_mock(func: Callable[[], Awaitable[Any]]) -> Any:
-                return await func()
-
-            mock_retry_handler.execute.side_effect = execute_mock
-
-            with pytest.raises(HttpClientRetryError) as exc_info:
-                await httpx_client.get(HttpUrl("https://api.example.com/data"))
-
-            assert exc_info.value.status_code == 503
-            assert "Request failed with status 503" in str(exc_info.value)
-
-    @pytest.mark.asyncio
-    async def test_get_non_retryable_error(
-        self,
-        httpx_client: HttpxClient,
-        mock_retry_handler: AsyncMock,
-    ) -> None:
-        """Test that non-retryable HTTP errors are handled correctly."""
-        mock_response = MagicMock()
-        mock_response.status_code = 400
-        mock_response.text = "Bad Request"
+        mock_response = FakeResponse(HTTPStatus.OK, "response")
 
         mock_client = AsyncMock()
         mock_client.get.return_value = mock_response
 
-        with patch.object(httpx_client, "_ensure_client", new_callable=AsyncMock):
-            httpx_client._client = mock_client
-
-            async def execute_mock(func: Callable[[], Awaitable[Any]]) -> Any:
-                return await func()
-
-            mock_retry_handler.execute.side_effect = execute_mock
-
-            with pytest.raises(HttpClientError) as exc_info:
-                await httpx_client.get(HttpUrl("https://api.example.com/data"))
-
-            assert exc_info.value.status_code == 400
-            assert "Request failed with status 400" in str(exc_info.value)
-
-    @pytest.mark.asyncio
-    async def test_get_timeout_error(
-        self,
-        httpx_client: HttpxClient,
-        mock_retry_handler: AsyncMock,
-    ) -> None:
-        """Test that timeout errors are handled correctly."""
-        mock_client = AsyncMock()
-        mock_client.get.side_effect = httpx.TimeoutException("Request timeout")
-
-        with patch.object(httpx_client, "_ensure_client", new_callable=AsyncMock):
-            httpx_client._client = mock_client
-
-            async def execute_mock(func: Callable[[], Awaitable[Any]]) -> Any:
-                return await func()
-
-            mock_retry_handler.execute.side_effect = execute_mock
-
-            with pytest.raises(HttpClientTimeoutError) as exc_info:
-                await httpx_client.get(HttpUrl("https://api.example.com/data"))
-
-            assert "Request timeout" in str(exc_info.value)
-
-    @pytest.mark.asyncio
-    async def test_get_connection_error(
-        self,
-        httpx_client: HttpxClient,
-        mock_retry_handler: AsyncMock,
-    ) -> None:
-        """Test that connection errors are handled correctly."""
-        mock_client = AsyncMock()
-        mock_client.get.side_effect = httpx.ConnectError("Connection failed")
-
-        with patch.object(httpx_client, "_ensure_client", new_callable=AsyncMock):
-            httpx_client._client = mock_client
-
-            async def execute_mock(func: Callable[[], Awaitable[Any]]) -> Any:
-                return await func()
+        httpx_client._client = mock_client
 
-            mock_retry_handler.execute.side_effect = execute_mock
+        await httpx_client.get(DATA_URL)
 
-            with pytest.raises(HttpClientConnectionError) as exc_info:
-                await httpx_client.get(HttpUrl("https://api.example.com/data"))
+        # Check that headers are passed
+        call_args = mock_client.get.call_args
+        headers = call_args.kwargs.get("headers", {})
 
-            assert "Connection failed" in str(exc_info.value)
+        assert headers.get("User-Agent") == "test-agent"
 
     @pytest.mark.asyncio
-    async def test_get_remote_protocol_error(
+    @pytest.mark.parametrize(
+        ("outcome", "expected_error", "expected_message"),
+        ERROR_PATH_CASES,
+    )
+    async def test_get_error_paths(
         self,
         httpx_client: HttpxClient,
-        mock_retry_handler: AsyncMock,
+        outcome: int | Exception | None,
+        expected_error: type[HttpClientError],
+        expected_message: str,
     ) -> None:
-        """Test that RemoteProtocolError is handled correctly."""
-        mock_client = AsyncMock()
-        mock_client.get.side_effect = httpx.RemoteProtocolError(
-            "Server disconnected without sending a response."
-        )
-
-        with patch.object(httpx_client, "_ensure_client", new_callable=AsyncMock):
+        """Test that failed responses and transport errors map to client errors."""
+        if outcome is not None:
+            mock_client = AsyncMock()
+            if isinstance(outcome, Exception):
+                mock_client.get.side_effect = outcome
+            else:
+                mock_response = FakeResponse(outcome, "error body")
+                mock_client.get.return_value = mock_response
             httpx_client._client = mock_client
 
-            async def execute_mock(func: Callable[[], Awaitable[Any]]) -> Any:
-                return await func()
-
-            mock_retry_handler.execute.side_effect = execute_mock
-
-            with pytest.raises(HttpClientConnectionError) as exc_info:
-                await httpx_client.get(HttpUrl("https://api.example.com/data"))
-
-            assert "Server disconnected without sending a response" in str(
-                exc_info.value
-            )
-
-    @pytest.mark.asyncio
-    async def test_get_client_not_initialized(
-        self,
-        httpx_client: HttpxClient,
-        mock_retry_handler: AsyncMock,
-    ) -> None:
-        """Test that error is raised when client is not initialized during request execution."""
-        # Mock _ensure_client to not set the client
-        with patch.object(httpx_client, "_ensure_client", new_callable=AsyncMock):
-            httpx_client._client = None
-
-            async def execute_mock(func: Callable[[], Awaitable[Any]]) -> Any:
-                return await func()
-
-            mock_retry_handler.execute.side_effect = execute_mock
+        with pytest.raises(expected_error, match=expected_message) as exc_info:
+            await httpx_client.get(DATA_URL)
 
-            with pytest.raises(HttpClientError) as exc_info:
-                await httpx_client.get(HttpUrl("https://api.example.com/data"))
-
-            assert "Client not initialized" in str(exc_info.value)
+        expected_status = outcome if isinstance(outcome, int) else None
+        assert exc_info.value.status_code == expected_status
 
     def test_build_url_no_params(self, httpx_client: HttpxClient) -> None:
         """Test URL building without parameters."""
-        url = HttpUrl("https://api.example.com/data")
-        result = httpx_client._build_url(url, None)
+        result = httpx_client._build_url(DATA_URL, None)
         assert result == "https://api.example.com/data"
 
     def test_build_url_with_params(self, httpx_client: HttpxClient) -> None:
         """Test URL building with parameters."""
-        url = HttpUrl("https://api.example.com/data")
         params = {"param1": "value1", "param2": "value2", "param3": None}
 
-        result = httpx_client._build_url(url, params)
+        result = httpx_client._build_url(DATA_URL, params)
 
         parsed_url = urlparse(result)
         query_params = parse_qs(parsed_url.query)
@@ -376,8 +301,7 @@ class TestHttpxClient:
 
     def test_build_url_empty_params(self, httpx_client: HttpxClient) -> None:
         """Test URL building with empty parameters."""
-        url = HttpUrl("https://api.example.com/data")
-        result = httpx_client._build_url(url, {})
+        result = httpx_client._build_url(DATA_URL, {})
         assert result == "https://api.example.com/data"
 
     def test_validate_url_valid(self, httpx_client: HttpxClient) -> None:
@@ -424,9 +348,7 @@ class TestHttpxClient:
     @pytest.mark.asyncio
     async def test_get_with_retry_integration(self) -> None:
         """Test that GET method properly integrates with retry handler."""
-        mock_response = MagicMock()
-        mock_response.status_code = HTTPStatus.OK
-        mock_response.text = "success"
+        mock_response = FakeResponse(HTTPStatus.OK, "success")
 
         mock_client = AsyncMock()
         mock_client.get.return_value = mock_response
@@ -437,65 +359,15 @@ class TestHttpxClient:
 
         # Create client with real retry handler
         config = EntsoEClientConfig(
-            api_token=SecretStr("test-token"),
-            base_url=HttpUrl("https://api.example.com"),
+            api_token=API_TOKEN,
+            base_url=BASE_URL,
         )
         client = HttpxClient(config, retry_handler)
 
-        with patch.object(client, "_ensure_client", new_callable=AsyncMock):
-            client._client = mock_client
-
-            result = await client.get(HttpUrl("https://api.example.com/data"))
-
-            assert result == "success"
-            mock_client.get.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_execute_request_http_status_error(
-        self,
-        httpx_client: HttpxClient,
-        mock_retry_handler: AsyncMock,
-    ) -> None:
-        """Test handling of httpx.HTTPStatusError."""
-        mock_client = AsyncMock()
-        mock_client.get.side_effect = httpx.HTTPStatusError(
-            "Status error",
-            request=MagicMock(),
-            response=MagicMock(),
-        )
-
-        with patch.object(httpx_client, "_ensure_client", new_callable=AsyncMock):
-            httpx_client._client = mock_client
-
-            async def execute_mock(func: Callable[[], Awaitable[Any]]) -> Any:
-                return await func()
-
-            mock_retry_handler.execute.side_effect = execute_mock
-
-            with pytest.raises(HttpClientError) as exc_info:
-                await httpx_client.get(HttpUrl("https://api.example.com/data"))
-
-            assert "HTTP status error" in str(exc_info.value)
-
-    @pytest.mark.asyncio
-    async def test_execute_request_generic_request_error(
-        self,
-        httpx_client: HttpxClient,
-        mock_retry_handler: AsyncMock,
-    ) -> None:
-        """Test handling of generic httpx.RequestError."""
-        mock_client = AsyncMock()
-        mock_client.get.side_effect = httpx.RequestError("Generic request error")
-
-        with patch.object(httpx_client, "_ensure_client", new_callable=AsyncMock):
-            httpx_client._client = mock_client
-
-            async def execute_mock(func: Callable[[], Awaitable[Any]]) -> Any:
-                return await func()
-
-            mock_retry_handler.execute.side_effect = execute_mock
+        client._ensure_client = AsyncMock()  # type: ignore[method-assign]
+        client._client = mock_client
 
-            with pytest.raises(HttpClientError) as exc_info:
-                await httpx_client.get(HttpUrl("https://api.example.com/data"))
+        result = await client.get(DATA_URL)
 
-            assert "Request failed" in str(exc_info.value)
+        assert result == "success"
+        mock_client.get.assert_called_once()
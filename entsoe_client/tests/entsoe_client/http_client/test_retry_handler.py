@@ -1,5 +1,7 @@
+import asyncio
+import logging
+from collections.abc import Awaitable
 from datetime import timedelta
-from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -13,6 +15,25 @@ from entsoe_client.http_client.exceptions import (
 from entsoe_client.http_client.retry_handler import RetryHandler
 
 
+class FakeOperation:
+    """Async operation that returns or raises the given outcomes in order.
+
+    The last outcome repeats once the others are used up, so a single
+    exception fails every attempt.
+    """
+
+    def __init__(self, *outcomes: object) -> None:
+        self._outcomes = list(outcomes)
+        self.calls = 0
+
+    async def __call__(self) -> object:
+        outcome = self._outcomes[min(self.calls, len(self._outcomes) - 1)]
+        self.calls += 1
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+
 class TestRetryHandler:
     """Test cases for RetryHandler class."""
 
@@ -31,35 +52,44 @@ class TestRetryHandler:
         """Create a RetryHandler instance for testing."""
         return RetryHandler(retry_config)
 
+    @pytest.fixture(autouse=True)
+    def sleep_calls(self, monkeypatch: pytest.MonkeyPatch) -> list[float]:
+        """Replace asyncio.sleep so retries never wait, recording each delay."""
+        calls: list[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            calls.append(delay)
+
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+        return calls
+
     @pytest.mark.asyncio
     async def test_execute_success_on_first_attempt(
         self,
         retry_handler: RetryHandler,
     ) -> None:
         """Test successful execution on first attempt."""
-        mock_operation = AsyncMock(return_value="success")
+        operation = FakeOperation("success")
 
-        result = await retry_handler.execute(mock_operation)
+        result = await retry_handler.execute(operation)
 
         assert result == "success"
-        mock_operation.assert_called_once()
+        assert operation.calls == 1
 
     @pytest.mark.asyncio
     async def test_execute_success_after_retry(
         self,
         retry_handler: RetryHandler,
+        sleep_calls: list[float],
     ) -> None:
         """Test successful execution after one retry."""
-        mock_operation = AsyncMock(
-            side_effect=[HttpClientTimeoutError("Timeout"), "success"],
-        )
+        operation = FakeOperation(HttpClientTimeoutError("Timeout"), "success")
 
-        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
-            result = await retry_handler.execute(mock_operation)
+        result = await retry_handler.execute(operation)
 
         assert result == "success"
-        assert mock_operation.call_count == 2
-        mock_sleep.assert_called_once()
+        assert operation.calls == 2
+        assert sleep_calls == [1.0]
 
     @pytest.mark.asyncio
     async def test_execute_fails_after_max_attempts(
@@ -67,116 +97,121 @@ class TestRetryHandler:
         retry_handler: RetryHandler,
     ) -> None:
         """Test failure after exhausting all retry attempts."""
-        mock_operation = AsyncMock(side_effect=HttpClientTimeoutError("Timeout"))
+        operation = FakeOperation(HttpClientTimeoutError("Timeout"))
 
-        with (
-            patch("asyncio.sleep", new_callable=AsyncMock),
-            pytest.raises(HttpClientTimeoutError),
-        ):
-            await retry_handler.execute(mock_operation)
+        with pytest.raises(HttpClientTimeoutError):
+            await retry_handler.execute(operation)
 
-        assert mock_operation.call_count == 3
+        assert operation.calls == 3
 
     @pytest.mark.asyncio
-    async def test_execute_retries_on_timeout_error(
+    @pytest.mark.parametrize(
+        "error",
+        [
+            HttpClientTimeoutError("Timeout"),
+            HttpClientConnectionError("Connection failed"),
+            HttpClientRetryError("Retry error", status_code=503),
+        ],
+        ids=["timeout", "connection", "retry"],
+    )
+    async def test_execute_retries_on_retryable_error(
         self,
         retry_handler: RetryHandler,
+        error: HttpClientError,
     ) -> None:
-        """Test that timeout errors trigger retries."""
-        mock_operation = AsyncMock(side_effect=HttpClientTimeoutError("Timeout"))
+        """Test that each retryable error triggers retries and is re-raised."""
+        operation = FakeOperation(error)
 
-        with (
-            patch("asyncio.sleep", new_callable=AsyncMock),
-            pytest.raises(HttpClientTimeoutError),
-        ):
-            await retry_handler.execute(mock_operation)
+        with pytest.raises(type(error)):
+            await retry_handler.execute(operation)
 
-        assert mock_operation.call_count == 3
+        assert operation.calls == 3
 
     @pytest.mark.asyncio
-    async def test_execute_retries_on_connection_error(
+    async def test_execute_does_not_retry_on_non_retryable_error(
         self,
         retry_handler: RetryHandler,
     ) -> None:
-        """Test that connection errors trigger retries."""
-        mock_operation = AsyncMock(
-            side_effect=HttpClientConnectionError("Connection failed"),
-        )
+        """Test that non-retryable errors don't trigger retries."""
+        operation = FakeOperation(ValueError("Not retryable"))
 
-        with (
-            patch("asyncio.sleep", new_callable=AsyncMock),
-            pytest.raises(HttpClientConnectionError),
-        ):
-            await retry_handler.execute(mock_operation)
+        with pytest.raises(HttpClientError) as exc_info:
+            await retry_handler.execute(operation)
 
-        assert mock_operation.call_count == 3
+        assert "Request execution failed" in str(exc_info.value)
+        assert operation.calls == 1
 
     @pytest.mark.asyncio
-    async def test_execute_retries_on_retry_error(
+    async def test_execute_logs_retry_attempts(
         self,
         retry_handler: RetryHandler,
+        caplog: pytest.LogCaptureFixture,
     ) -> None:
-        """Test that retry errors trigger retries."""
-        mock_operation = AsyncMock(
-            side_effect=HttpClientRetryError("Retry error", status_code=503),
-        )
+        """Test that retry attempts are logged under the operation's name."""
+        fake_operation = FakeOperation(HttpClientTimeoutError("Timeout"), "success")
 
-        with (
-            patch("asyncio.sleep", new_callable=AsyncMock),
-            pytest.raises(HttpClientRetryError),
+        async def fetch_document() -> object:
+            return await fake_operation()
+
+        with caplog.at_level(
+            logging.WARNING, logger="entsoe_client.http_client.retry_handler"
         ):
-            await retry_handler.execute(mock_operation)
+            result = await retry_handler.execute(fetch_document)
 
-        assert mock_operation.call_count == 3
+        assert result == "success"
+        assert len(caplog.records) == 1
+        assert fetch_document.__qualname__ in caplog.text
+        assert "<locals>.attempt" not in caplog.text
 
     @pytest.mark.asyncio
-    async def test_execute_does_not_retry_on_non_retryable_error(
-        self,
-        retry_handler: RetryHandler,
-    ) -> None:
-        """Test that non-retryable errors don't trigger retries."""
-        mock_operation = AsyncMock(side_effect=ValueError("Not retryable"))
+    async def test_execute_respects_max_attempts_config(self) -> None:
+        """Test that max_attempts configuration is respected."""
+        config = RetryConfig(max_attempts=2)
+        handler = RetryHandler(config)
+        operation = FakeOperation(HttpClientTimeoutError("Timeout"))
 
-        with pytest.raises(HttpClientError) as exc_info:
-            await retry_handler.execute(mock_operation)
+        with pytest.raises(HttpClientTimeoutError):
+            await handler.execute(operation)
 
-        assert "Request execution failed" in str(exc_info.value)
-        mock_operation.assert_called_once()
+        assert operation.calls == 2
 
     @pytest.mark.asyncio
-    async def test_execute_logs_retry_attempts(
+    async def test_execute_concurrent_calls_retry_independently(
         self,
         retry_handler: RetryHandler,
     ) -> None:
-        """Test that retry attempts are logged."""
-        mock_operation = AsyncMock(
-            side_effect=[HttpClientTimeoutError("Timeout"), "success"],
+        """Test that concurrent executions on one handler keep separate attempts."""
+        failing_operation = FakeOperation(HttpClientTimeoutError("Timeout"))
+        recovering_operation = FakeOperation(
+            HttpClientTimeoutError("Timeout"), "success"
         )
 
-        with (
-            patch("asyncio.sleep", new_callable=AsyncMock),
-            patch("entsoe_client.http_client.retry_handler.logger"),
-        ):
-            result = await retry_handler.execute(mock_operation)
+        failure, result = await asyncio.gather(
+            retry_handler.execute(failing_operation),
+            retry_handler.execute(recovering_operation),
+            return_exceptions=True,
+        )
 
+        assert isinstance(failure, HttpClientTimeoutError)
         assert result == "success"
-        # tenacity's before_sleep_log should have been called
-        # We can't easily test the exact log message, but we can verify the operation succeeded
+        assert failing_operation.calls == 3
+        assert recovering_operation.calls == 2
 
     @pytest.mark.asyncio
-    async def test_execute_respects_max_attempts_config(self) -> None:
-        """Test that max_attempts configuration is respected."""
-        config = RetryConfig(max_attempts=2)
-        handler = RetryHandler(config)
-        mock_operation = AsyncMock(side_effect=HttpClientTimeoutError("Timeout"))
+    async def test_execute_retries_function_returning_coroutine(
+        self,
+        retry_handler: RetryHandler,
+    ) -> None:
+        """Test that a plain function returning a coroutine is retried."""
+        fake_operation = FakeOperation(HttpClientTimeoutError("Timeout"), "success")
 
-        with (
-            patch("asyncio.sleep", new_callable=AsyncMock),
-            pytest.raises(HttpClientTimeoutError),
-        ):
-            await handler.execute(mock_operation)
+        def operation() -> Awaitable[object]:
+            return fake_operation()
 
-        assert mock_operation.call_count == 2
+        result = await retry_handler.execute(operation)
+
+        assert result == "success"
+        assert fake_operation.calls == 2
 
     def test_get_retryable_exceptions(self, retry_handler: RetryHandler) -> None:
         """Test that retryable exceptions are correctly identified."""
@@ -191,25 +226,22 @@ class TestRetryHandler:
         assert retryable_exceptions == expected_exceptions
 
     @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "expected",
+        [{"key": "value"}, [1, 2, 3], None],
+        ids=["dict", "list", "none"],
+    )
     async def test_execute_with_different_return_types(
         self,
         retry_handler: RetryHandler,
+        expected: object,
     ) -> None:
-        """Test that execute works with different return types."""
-        # Test with dict
-        mock_operation = AsyncMock(return_value={"key": "value"})
-        result = await retry_handler.execute(mock_operation)
-        assert result == {"key": "value"}
-
-        # Test with list
-        mock_operation = AsyncMock(return_value=[1, 2, 3])
-        result = await retry_handler.execute(mock_operation)
-        assert result == [1, 2, 3]
-
-        # Test with None
-        mock_operation = AsyncMock(return_value=None)
-        result = await retry_handler.execute(mock_operation)
-        assert result is None
+        """Test that execute passes through the operation's return value."""
+        operation = FakeOperation(expected)
+
+        result = await retry_handler.execute(operation)
+
+        assert result == expected
 
     @pytest.mark.asyncio
     async def test_execute_with_mixed_exceptions(
@@ -217,18 +249,12 @@ class TestRetryHandler:
         retry_handler: RetryHandler,
     ) -> None:
         """Test behavior with mixed retryable and non-retryable exceptions."""
-        mock_operation = AsyncMock(
-            side_effect=[
-                HttpClientTimeoutError("Timeout"),
-                ValueError("Not retryable"),
-            ],
+        operation = FakeOperation(
+            HttpClientTimeoutError("Timeout"), ValueError("Not retryable")
         )
 
-        with (
-            patch("asyncio.sleep", new_callable=AsyncMock),
-            pytest.raises(HttpClientError) as exc_info,
-        ):
-            await retry_handler.execute(mock_operation)
+        with pytest.raises(HttpClientError) as exc_info:
+            await retry_handler.execute(operation)
 
         assert "Request execution failed" in str(exc_info.value)
-        assert mock_operation.call_count == 2
+        assert operation.calls == 2
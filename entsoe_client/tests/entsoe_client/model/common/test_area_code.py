@@ -8,6 +8,23 @@ from entsoe_client.exceptions.unknown_area_code_error import UnknownAreaCodeErro
 from entsoe_client.model.common.area_code import AreaCode
 from entsoe_client.model.common.area_type import AreaType
 
+# Regional and composite codes now return their area_code instead of a regex match
+COUNTRY_CODE_CASES = (
+    (AreaCode.FRANCE, "FR"),
+    (AreaCode.GERMANY, "DE"),
+    (AreaCode.SPAIN, "ES"),
+    (AreaCode.ITALY, "IT"),
+    (AreaCode.BELGIUM, "BE"),
+    (AreaCode.NETHERLANDS, "NL"),
+    (AreaCode.POLAND, "PL"),
+    (AreaCode.UNITED_KINGDOM, "UK"),
+    (AreaCode.SWEDEN_SE1, "SE1"),
+    (AreaCode.DENMARK_DK1, "DK1"),
+    (AreaCode.IT_SACOAC, "IT-SACOAC"),
+    (AreaCode.UKRAINE_BEI, "UA-BEI"),
+    (AreaCode.CWE_REGION, "CWE"),
+)
+
 
 class TestAreaCodeFromCode:
     """Test the from_code class method."""
@@ -28,6 +45,11 @@ class TestAreaCodeFromCode:
                 AreaCode.from_code(invalid_code)
             assert invalid_code in str(exc_info.value)
 
+    def test_from_code_round_trips_every_member(self) -> None:
+        """Test from_code resolves the code of every enum member back to it."""
+        for member in AreaCode:
+            assert AreaCode.from_code(member.code) is member
+
 
 class TestAreaCodeSafeFromCode:
     """Test the _safe_from_code method."""
@@ -82,57 +104,21 @@ class TestAreaCodeAreaCodeProperty:
 class TestAreaCodeCountryCodeDeprecated:
     """Test the deprecated get_country_code method."""
 
-    @pytest.mark.parametrize(
-        ("area_code", "expected_country"),
-        [
-            (AreaCode.FRANCE, "FR"),
-            (AreaCode.GERMANY, "DE"),
-            (AreaCode.SPAIN, "ES"),
-            (AreaCode.ITALY, "IT"),
-            (AreaCode.BELGIUM, "BE"),
-            (AreaCode.NETHERLANDS, "NL"),
-            (AreaCode.POLAND, "PL"),
-            (AreaCode.UNITED_KINGDOM, "UK"),
-            (
-                AreaCode.SWEDEN_SE1,
-                "SE1",
-            ),  # Now returns area_code instead of regex match
-            (
-                AreaCode.DENMARK_DK1,
-                "DK1",
-            ),  # Now returns area_code instead of regex match
-            (
-                AreaCode.IT_SACOAC,
-                "IT-SACOAC",
-            ),  # Now returns area_code instead of regex match
-            (
-                AreaCode.UKRAINE_BEI,
-                "UA-BEI",
-            ),  # Now returns area_code instead of regex match
-            (
-                AreaCode.CWE_REGION,
-                "CWE",
-            ),  # Now returns area_code instead of regex match
-        ],
-    )
-    def test_get_country_code_with_deprecation_warning(
-        self,
-        area_code: AreaCode,
-        expected_country: str,
-    ) -> None:
+    def test_get_country_code_with_deprecation_warning(self) -> None:
         """Test deprecated get_country_code method shows warning and returns area_code."""
         with warnings.catch_warnings(record=True) as w:
             warnings.simplefilter("always")
-            result = area_code.get_country_code()
 
-            # Check deprecation warning was issued
-            assert len(w) == 1
-            assert issubclass(w[0].category, DeprecationWarning)
-            assert "get_country_code() is deprecated" in str(w[0].message)
-            assert "Use the area_code property instead" in str(w[0].message)
+            for area_code, expected_country in COUNTRY_CODE_CASES:
+                # Check it returns the area_code (new behavior)
+                assert area_code.get_country_code() == expected_country, area_code
 
-            # Check it returns the area_code (new behavior)
-            assert result == expected_country
+            # Check one deprecation warning was issued per call
+            assert len(w) == len(COUNTRY_CODE_CASES)
+            for warning in w:
+                assert issubclass(warning.category, DeprecationWarning)
+                assert "get_country_code() is deprecated" in str(warning.message)
+                assert "Use the area_code property instead" in str(warning.message)
 
     def test_get_country_code_regional_areas_now_return_area_code(self) -> None:
         """Test that regional codes now return their area_code instead of None."""
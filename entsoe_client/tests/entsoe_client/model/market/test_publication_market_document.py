@@ -1,5 +1,6 @@
 """Tests for PublicationMarketDocument model."""
 
+import math
 from datetime import datetime, timezone
 
 import pytest
@@ -168,6 +169,56 @@ class TestPublicationMarketDocumentXmlParsing:
         # and access the basic structure, even if some detailed fields
         # need further XML parsing refinement
 
+    def test_to_arrays_flattens_points(self, sample_price_xml: str) -> None:
+        """Test that to_arrays exposes every point as index-aligned columns."""
+        cleaned_xml = remove_xml_namespaces(sample_price_xml)
+        document = PublicationMarketDocument.from_xml(cleaned_xml.encode())
+
+        arrays = document.to_arrays()
+
+        assert len(arrays) == 8
+        assert arrays.series_indices.tolist() == [0, 0, 0, 0, 1, 1, 1, 1]
+        assert arrays.positions.tolist() == [1, 2, 3, 4, 1, 2, 3, 4]
+        assert arrays.price_amounts.tolist() == [
+            88.33,
+            80.75,
+            77.23,
+            75.91,
+            95.33,
+            89.32,
+            87.61,
+            85.05,
+        ]
+        assert all(math.isnan(quantity) for quantity in arrays.quantities)
+
+    def test_to_arrays_marks_missing_position_with_zero(
+        self, sample_price_xml: str
+    ) -> None:
+        """Test that a point without a position gets the 0 sentinel."""
+        xml_without_position = sample_price_xml.replace("<position>2</position>", "", 1)
+        cleaned_xml = remove_xml_namespaces(xml_without_position)
+        document = PublicationMarketDocument.from_xml(cleaned_xml.encode())
+
+        arrays = document.to_arrays()
+
+        assert document.timeSeries[0].period.points[1].position is None
+        assert arrays.positions.tolist() == [1, 0, 3, 4, 1, 2, 3, 4]
+        assert arrays.price_amounts[1] == 80.75
+
+    def test_xml_parsing_ignores_unmodeled_elements(
+        self, sample_price_xml: str
+    ) -> None:
+        """Test that trailing elements the models do not declare are not rejected."""
+        xml_with_extras = sample_price_xml.replace(
+            "</Period>",
+            "</Period><unmodeled.element>X</unmodeled.element>",
+        )
+        cleaned_xml = remove_xml_namespaces(xml_with_extras)
+        document = PublicationMarketDocument.from_xml(cleaned_xml.encode())
+
+        assert len(document.timeSeries) == 2
+        assert document.timeSeries[0].mRID == "1"
+
     @pytest.fixture
     def sample_physical_flows_xml(self) -> str:
         """Real XML sample for physical flows from ENTSO-E API."""
@@ -2,7 +2,10 @@
 
 import pytest
 
-from entsoe_client.utils.xml_namespace_utils import remove_xml_namespaces
+from entsoe_client.utils.xml_namespace_utils import (
+    remove_xml_namespaces,
+    remove_xml_namespaces_async,
+)
 
 
 class TestXmlNamespaceUtils:
@@ -60,3 +63,22 @@ class TestXmlNamespaceUtils:
 
         with pytest.raises(ValueError, match="Failed to parse XML content"):
             remove_xml_namespaces(invalid_xml)
+
+    @pytest.mark.asyncio
+    async def test_remove_xml_namespaces_async_matches_sync(self) -> None:
+        """Test async namespace removal produces the same output as the sync variant."""
+        xml_with_namespace = """<?xml version="1.0" encoding="UTF-8"?>
+        <Publication_MarketDocument xmlns="urn:iec62325.351:tc57wg16:451-3:publicationdocument:7:3">
+            <mRID>test-123</mRID>
+        </Publication_MarketDocument>"""
+
+        result = await remove_xml_namespaces_async(xml_with_namespace)
+
+        assert result == remove_xml_namespaces(xml_with_namespace)
+        assert "xmlns=" not in result
+
+    @pytest.mark.asyncio
+    async def test_remove_xml_namespaces_async_invalid_xml(self) -> None:
+        """Test async namespace removal propagates parse errors."""
+        with pytest.raises(ValueError, match="Failed to parse XML content"):
+            await remove_xml_namespaces_async("<unclosed_tag>content")